@@ -0,0 +1,36 @@
+"""
+Win-path analysis for the prediction game.
+
+Load a season with ``load_game`` (or build a ``GameData`` directly), run
+one of the engines over its ``predictions`` and ``outcomes``, and print
+the result with ``print_report``. Nothing is computed at import.
+"""
+
+from .engine import (
+    WINNER_ENGINES,
+    BlockScorer,
+    ByteTableScorer,
+    Rankings,
+    ScenarioStats,
+    SplitTableScorer,
+    WinnerArray,
+    bit_sliced_winners,
+    branch_and_bound_winners,
+    byte_table_winners,
+    gray_code_winners,
+    loop_winners,
+    monte_carlo_winners,
+    parallel_winners,
+    state_dp_winners,
+    tie_breaker,
+    vectorized_winners,
+)
+from .counting import (
+    count_at_least,
+    distribution_summary,
+    head_to_head,
+    score_at_least,
+    score_distributions,
+)
+from .loader import GameData, load_game, validate_game
+from .report import print_report
@@ -0,0 +1,137 @@
+"""
+Command line entry point: python -m prediction_game data/<year>.json
+
+Options come from environment variables, as in the archive scripts:
+ENGINE (parallel, array, montecarlo, or one of ``WINNER_ENGINES``),
+WORKERS, WINNER_ARRAY, CI_WIDTH, SEED, WHAT_IF, JSON_OUTPUT and FULL_GUTS.
+"""
+
+import os
+import sys
+
+from .engine import (
+    WINNER_ENGINES,
+    WinnerArray,
+    monte_carlo_winners,
+    parallel_winners,
+)
+from .loader import load_game
+from .report import print_report
+
+
+def compute_stats(game, engine="parallel", workers=None, array_path=None, ci_width=0.01, seed=2025):
+    """Runs the named engine over ``game``; raises ValueError for unusable settings."""
+    probabilities = game.unresolved_probabilities()
+    if probabilities is not None and engine != "parallel":
+        raise ValueError("probability-weighted outcomes need ENGINE=parallel")
+
+    if engine == "parallel":
+        return parallel_winners(
+            game.predictions, game.outcomes, workers, probabilities=probabilities
+        )
+    if engine == "array":
+        # winners for every y/n combination of the whole season, built once;
+        # the current outcomes just pick out a slice of it
+        # rebuilt whenever the rankings or questions differ from the cached ones
+        array_path = array_path or f"winners-{game.year}"
+        if not os.path.exists(array_path + ".meta.json") or not WinnerArray(array_path).built_for(
+            game.predictions, game.question_ids
+        ):
+            WinnerArray.build(
+                array_path,
+                game.predictions,
+                ["m"] * len(game.outcomes),
+                question_ids=game.question_ids,
+            )
+        try:
+            return WinnerArray(array_path).stats(
+                game.predictions, game.outcomes, question_ids=game.question_ids
+            )
+        except ValueError as error:
+            raise ValueError(f"{array_path}: {error}; delete it to rebuild") from error
+    if engine == "montecarlo":
+        return monte_carlo_winners(
+            game.predictions, game.outcomes, target_width=ci_width, seed=seed
+        )
+    if engine not in WINNER_ENGINES:
+        raise ValueError(f"unknown ENGINE {engine!r}")
+    return WINNER_ENGINES[engine](game.predictions, game.outcomes)
+
+
+def parse_what_if(text, game):
+    """
+    Reads WHAT_IF ("M=y" or "M=y,N=n") into {question id: "y"/"n"}.
+
+    Raises ValueError unless there are one or two conditions, each on a
+    distinct unresolved question of ``game``, each y or n.
+    """
+    outcome_by_question = dict(zip(game.question_ids, game.outcomes))
+    what_if = {}
+    for item in text.split(","):
+        question, separator, outcome = (part.strip() for part in item.partition("="))
+        if not separator:
+            raise ValueError(f"{item!r} is not QUESTION=y or QUESTION=n")
+        if question not in outcome_by_question:
+            raise ValueError(f"unknown question {question!r}")
+        if outcome_by_question[question] != "m":
+            raise ValueError(f"question {question} is already resolved")
+        if outcome not in ("y", "n"):
+            raise ValueError(f"{question}={outcome} should be {question}=y or {question}=n")
+        if question in what_if:
+            raise ValueError(f"question {question} is given twice")
+        what_if[question] = outcome
+    if len(what_if) > 2:
+        raise ValueError("at most two questions can be fixed at once")
+    return what_if
+
+
+def run(game):
+    """Computes stats with the settings in the environment and prints the report."""
+    engine = os.environ.get("ENGINE", "parallel")
+    seed = int(os.environ.get("SEED", 2025))
+    what_if = None
+    if os.environ.get("WHAT_IF"):
+        if engine == "dp":
+            sys.exit("WHAT_IF needs an engine that fills the pair table, not ENGINE=dp")
+        try:
+            what_if = parse_what_if(os.environ["WHAT_IF"], game)
+        except ValueError as error:
+            sys.exit(f"WHAT_IF: {error}")
+
+    try:
+        stats = compute_stats(
+            game,
+            engine,
+            workers=int(os.environ.get("WORKERS", 0)) or None,
+            array_path=os.environ.get("WINNER_ARRAY"),
+            ci_width=float(os.environ.get("CI_WIDTH", 0.01)),
+            seed=seed,
+        )
+    except ValueError as error:
+        sys.exit(str(error))
+
+    scenario_count = 2 ** game.outcomes.count("m")
+    if stats.sampled:
+        print(f"sampled {stats.total} of {scenario_count} scenarios (seed {seed})")
+    elif engine == "montecarlo":
+        print(f"all {scenario_count} scenarios scored exactly")
+    print_report(
+        game,
+        stats,
+        sampled=stats.sampled,
+        what_if=what_if,
+        json_output=os.environ.get("JSON_OUTPUT"),
+        full_guts=bool(os.environ.get("FULL_GUTS")),
+    )
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m prediction_game <data-file.json>")
+        sys.exit(1)
+    try:
+        game = load_game(argv[0])
+    except ValueError as error:
+        sys.exit(f"Validation errors in {argv[0]}:\n{error}")
+    run(game)
@@ -0,0 +1,153 @@
+"""
+Exact scenario counts that don't enumerate all 2^n scenarios.
+
+``predictions`` and ``outcomes`` are as in ``engine``. Passing
+``probabilities`` (chance of yes per unresolved question, as from
+``GameData.unresolved_probabilities``) turns every count into the total
+probability of the scenarios counted.
+"""
+
+import numpy as np
+
+from .engine import ranking_matrix
+
+
+def unresolved_rankings(predictions, outcomes):
+    """Returns (current scores, contestants x unresolved questions rankings)."""
+    rankings = ranking_matrix(predictions, len(outcomes))
+    is_yes = np.array([outcome == "y" for outcome in outcomes], dtype=bool)
+    is_open = np.array([outcome == "m" for outcome in outcomes], dtype=bool)
+    return rankings[:, is_yes].sum(axis=1), rankings[:, is_open]
+
+
+def subset_sums(values, probabilities=None):
+    """
+    Returns (sums, weights) over every subset of ``values`` (the questions that came true).
+
+    Both have 2**len(values) entries. Weights are 1, or each subset's
+    probability when ``probabilities`` are given.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    bits = (np.arange(2 ** len(values), dtype=np.int64)[:, None] >> np.arange(len(values))) & 1
+    sums = bits @ values
+    if probabilities is None:
+        return sums, np.ones(len(sums), dtype=np.int64)
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    return sums, np.where(bits, probabilities, 1 - probabilities).prod(axis=1)
+
+
+def count_at_least(values, thresholds, probabilities=None):
+    """
+    Scenarios where the ``values`` of the questions that came true sum to at least each threshold.
+
+    Meet in the middle: the questions split in half, the second half's
+    2**(n/2) subset sums are sorted once, and every first-half sum finds
+    how many second-half sums complete it with one binary search, so the
+    cost is O(2**(n/2) log) instead of 2**n. Returns one count per
+    threshold (a probability with ``probabilities``).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    half = len(values) // 2
+    if probabilities is None:
+        first_probabilities = second_probabilities = None
+    else:
+        first_probabilities, second_probabilities = probabilities[:half], probabilities[half:]
+    first_sums, first_weights = subset_sums(values[:half], first_probabilities)
+    second_sums, second_weights = subset_sums(values[half:], second_probabilities)
+
+    order = np.argsort(second_sums, kind="stable")
+    second_sums = second_sums[order]
+    # weight of the sorted second-half sums from each position to the end
+    tail_weights = np.zeros(len(order) + 1, dtype=second_weights.dtype)
+    tail_weights[:-1] = np.cumsum(second_weights[order][::-1])[::-1]
+
+    thresholds = np.asarray(thresholds, dtype=np.int64)
+    positions = np.searchsorted(second_sums, thresholds[..., None] - first_sums)
+    return (first_weights * tail_weights[positions]).sum(axis=-1)
+
+
+def score_at_least(predictions, outcomes, contestant, thresholds, probabilities=None):
+    """Scenarios where ``contestant`` finishes with at least each threshold in points."""
+    scores, open_rankings = unresolved_rankings(predictions, outcomes)
+    index = list(predictions).index(contestant)
+    return count_at_least(
+        open_rankings[index], np.asarray(thresholds) - scores[index], probabilities
+    )
+
+
+def head_to_head(predictions, outcomes, probabilities=None):
+    """
+    Contestants x contestants: scenarios where the row finishes ahead of the column.
+
+    "Ahead" is strictly more points; a tie on points counts for neither, so
+    the ties are ``total - ahead - ahead.T``. Each pair is one
+    ``count_at_least`` over the difference of their rankings, which gives
+    both directions at once.
+    """
+    scores, open_rankings = unresolved_rankings(predictions, outcomes)
+    contestant_count = len(scores)
+    if probabilities is None:
+        ahead = np.zeros((contestant_count, contestant_count), dtype=np.int64)
+        total = 2 ** open_rankings.shape[1]
+    else:
+        ahead = np.zeros((contestant_count, contestant_count), dtype=np.float64)
+        total = 1.0
+
+    for a in range(contestant_count):
+        for b in range(a + 1, contestant_count):
+            # a's final lead is its current lead plus the gained difference
+            lead = scores[a] - scores[b]
+            lead_at_least_one, lead_at_least_zero = count_at_least(
+                open_rankings[a] - open_rankings[b], [1 - lead, -lead], probabilities
+            )
+            ahead[a, b] = lead_at_least_one
+            ahead[b, a] = total - lead_at_least_zero
+    return ahead
+
+
+def score_distributions(predictions, outcomes, probabilities=None):
+    """
+    Contestants x final score: scenarios ending on each score.
+
+    Each unresolved question is a two-point distribution, adding nothing
+    (no) or its ranking (yes), and a contestant's final score is the sum of
+    those, so the distribution is their convolution: one shift-and-add per
+    question, O(questions x max score) instead of 2**n. With
+    ``probabilities`` the yes side is weighted by the chance of yes and the
+    rows hold probabilities.
+    """
+    scores, open_rankings = unresolved_rankings(predictions, outcomes)
+    contestant_count, open_count = open_rankings.shape
+    score_count = int((scores + open_rankings.sum(axis=1)).max(initial=0)) + 1
+    dtype = np.int64 if probabilities is None else np.float64
+    distributions = np.zeros((contestant_count, score_count), dtype=dtype)
+    distributions[np.arange(contestant_count), scores] = 1
+
+    score_values = np.arange(score_count)
+    for question in range(open_count):
+        yes = 1 if probabilities is None else probabilities[question]
+        no = 1 if probabilities is None else 1 - probabilities[question]
+        # every row shifted right by that contestant's ranking for the question
+        source = score_values - open_rankings[:, question, None]
+        shifted = np.where(
+            source >= 0, np.take_along_axis(distributions, np.maximum(source, 0), axis=1), 0
+        )
+        distributions = no * distributions + yes * shifted
+    return distributions
+
+
+def distribution_summary(distribution, percentiles=(10, 25, 50, 75, 90)):
+    """
+    Returns (mean, {percentile: score}) for one row of ``score_distributions``.
+
+    A percentile is the lowest score that at least that share of the
+    outcomes end on or below.
+    """
+    distribution = np.asarray(distribution, dtype=np.float64)
+    shares = distribution / distribution.sum()
+    mean = float(shares @ np.arange(len(shares)))
+    cumulative = np.cumsum(shares)
+    return mean, {
+        percentile: int(np.searchsorted(cumulative, percentile / 100 - 1e-12))
+        for percentile in percentiles
+    }
@@ -0,0 +1,1751 @@
+"""
+Scenario engines: score every way the unresolved questions can go.
+
+Each engine takes ``predictions`` (contestant -> rankings, one per
+question) and ``outcomes`` (one "y"/"n"/"m" per question) and returns a
+``ScenarioStats``. Scenario ``i`` fills in the unresolved questions with
+the binary digits of ``i``, most significant first.
+"""
+
+import collections.abc
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import math
+import os
+
+import numpy as np
+
+
+
+# folds scenarios [start, end) into a ScenarioStats, one at a time
+def winners_optimized(predictions, outcomes, start, end):
+    stats = ScenarioStats(predictions, outcomes)
+    contestant_index = {c: i for i, c in enumerate(stats.contestants)}
+    unresolved_indices = [i for i, outcome in enumerate(outcomes) if outcome == "m"]
+    resolved_outcomes = "".join(
+        "y" if outcome == "y" else "n" if outcome == "n" else "_"
+        for outcome in outcomes
+    )
+
+    for i in range(start, end):
+        binary = format(i, f"0{len(unresolved_indices)}b")
+        current_outcome = list(resolved_outcomes)
+        for idx, bit in zip(unresolved_indices, binary):
+            current_outcome[idx] = "y" if bit == "1" else "n"
+        current_outcome = "".join(current_outcome)
+
+        points_per_prediction = {
+            k: points(v, current_outcome) for k, v in predictions.items()
+        }
+        max_points = max(points_per_prediction.values())
+        possible_winners = [
+            predictor
+            for predictor, points in points_per_prediction.items()
+            if points == max_points
+        ]
+
+        if len(possible_winners) == 1:
+            winner = possible_winners[0]
+        else:
+            # Use tie-breaker to determine winner among tied contestants
+            winner = tie_breaker(predictions, current_outcome, possible_winners)
+
+        stats.add_scenario(
+            current_outcome,
+            contestant_index[winner],
+            [contestant_index[c] for c in possible_winners],
+        )
+
+    return stats
+
+
+def loop_winners(predictions, outcomes):
+    unresolved_count = outcomes.count("m")
+    total_combinations = 2**unresolved_count
+    return winners_optimized(predictions, outcomes, 0, total_combinations)
+
+
+def parallel_winners(
+    predictions, outcomes, workers=None, chunks_per_worker=4, probabilities=None
+):
+    """
+    Scores the 2^n scenario range in chunks across a process pool.
+
+    Each chunk comes back as a ``ScenarioStats`` of plain counters, so the
+    merged result is identical to the serial path for any worker count.
+    Passing ``probabilities`` gives probability-weighted stats instead.
+    """
+    total_combinations = 2 ** outcomes.count("m")
+    workers = workers or os.cpu_count() or 1
+    chunk_count = min(total_combinations, workers * chunks_per_worker)
+    bounds = [total_combinations * k // chunk_count for k in range(chunk_count + 1)]
+    starts, ends = bounds[:-1], bounds[1:]
+    chunk_args = (
+        [predictions] * chunk_count,
+        [outcomes] * chunk_count,
+        starts,
+        ends,
+        [probabilities] * chunk_count,
+    )
+    weighted = probabilities is not None
+
+    if workers == 1:
+        partials = map(winners_chunk, *chunk_args)
+        return merge_stats(predictions, outcomes, partials, weighted)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        partials = pool.map(winners_chunk, *chunk_args)
+        return merge_stats(predictions, outcomes, partials, weighted)
+
+
+def points(rankings, outcomes):
+    total = 0
+    for ranking, outcome in zip(rankings, outcomes):
+        if outcome == "y":
+            total += ranking
+    return total
+
+
+def tie_breaker(predictions_dict, outcomes, tied_contestants):
+    """
+    Break ties by comparing highest-ranked correct predictions.
+    Returns the winner among the tied contestants.
+    """
+    if len(tied_contestants) == 1:
+        return tied_contestants[0]
+    
+    # For each tied contestant, get their highest-ranked correct predictions
+    contestant_rankings = {}
+    for contestant in tied_contestants:
+        rankings = predictions_dict[contestant]
+        # Get all correct predictions (where outcome == "y") with their rankings
+        correct_predictions = []
+        for ranking, outcome in zip(rankings, outcomes):
+            if outcome == "y":
+                correct_predictions.append(ranking)
+        # Sort in descending order (highest first)
+        contestant_rankings[contestant] = sorted(correct_predictions, reverse=True)
+    
+    # Compare rankings level by level
+    max_levels = max(len(rankings) for rankings in contestant_rankings.values())
+    
+    for level in range(max_levels):
+        level_scores = {}
+        for contestant in tied_contestants:
+            rankings = contestant_rankings[contestant]
+            if level < len(rankings):
+                level_scores[contestant] = rankings[level]
+            else:
+                level_scores[contestant] = 0  # No more correct predictions
+        
+        # Find the highest score at this level
+        max_score = max(level_scores.values())
+        winners_at_level = [c for c, score in level_scores.items() if score == max_score]
+        
+        # If only one winner at this level, they win the tiebreaker
+        if len(winners_at_level) == 1:
+            return winners_at_level[0]
+        
+        # If still tied, continue to next level
+        tied_contestants = winners_at_level
+    
+    # If we get here, all tied contestants are completely identical
+    # Return the first one alphabetically (original behavior)
+    return sorted(tied_contestants)[0]
+
+
+# scenarios scored per numpy block; 2^16 rows keeps a block's arrays small
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+class Rankings(collections.abc.Mapping):
+    """
+    Contestant -> rankings, backed by one contestants x questions int64 matrix.
+
+    Reads like a predictions dict (rows come back as plain int lists), but
+    ``ranking_matrix`` hands the engines ``matrix`` itself instead of
+    rebuilding it from the rows, and only the names and the matrix are
+    pickled for worker processes.
+    """
+
+    def __init__(self, contestants, matrix):
+        self.contestants = list(contestants)
+        self.matrix = np.asarray(matrix, dtype=np.int64)
+        self._positions = {contestant: idx for idx, contestant in enumerate(self.contestants)}
+        self._rows = None
+
+    def __getitem__(self, contestant):
+        if self._rows is None:
+            self._rows = self.matrix.tolist()
+        return self._rows[self._positions[contestant]]
+
+    def __iter__(self):
+        return iter(self.contestants)
+
+    def __len__(self):
+        return len(self.contestants)
+
+    def __getstate__(self):
+        return self.contestants, self.matrix
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+def ranking_matrix(predictions, question_count):
+    """Contestants x questions int64 rankings, reused as is from ``Rankings``."""
+    if isinstance(predictions, Rankings):
+        return predictions.matrix
+    return np.array(list(predictions.values()), dtype=np.int64).reshape(
+        len(predictions), question_count
+    )
+
+
+def tie_break_key_contributions(rankings):
+    """
+    Per-contestant, per-question contributions to a composite winner key.
+
+    Every row of ``rankings`` is a permutation of 1..N, so comparing sorted
+    correct rankings level by level (``tie_breaker``) is the same as
+    comparing the sum of 2**rank over correct questions. Packing the score
+    above that mask makes "max over (score, mask)" a plain integer max:
+    ``key >> shift`` is the score and the low ``shift`` bits are the mask.
+
+    Returns (contributions, shift).
+    """
+    rankings = np.asarray(rankings, dtype=np.int64)
+    shift = rankings.shape[1] + 1
+    if (int(rankings.sum(axis=1).max()) + 1) << shift >= 2**63:
+        raise ValueError("too many questions to pack tie-break keys into int64")
+    return (rankings << shift) + (np.int64(1) << rankings), shift
+
+
+def eliminated_contestants(rankings, outcomes, leader_count=64):
+    """
+    Boolean mask of contestants who can never reach the top score.
+
+    A contestant is out when someone else stays strictly ahead of them in
+    every scenario. The quick check compares best cases against the best
+    worst case; the pairwise check takes someone's current lead and
+    subtracts everything the trailing contestant could still gain on them.
+    Only the ``leader_count`` highest current scores are tried as the one
+    staying ahead, which keeps big fields linear and the check sound.
+    """
+    rankings = np.asarray(rankings, dtype=np.int64)
+    is_yes = np.array([outcome == "y" for outcome in outcomes])
+    is_open = np.array([outcome == "m" for outcome in outcomes])
+    scores = rankings[:, is_yes].sum(axis=1)
+    open_rankings = rankings[:, is_open]
+
+    eliminated = scores + open_rankings.sum(axis=1) < scores.max()
+    survivors = np.flatnonzero(~eliminated)
+    leaders = survivors[np.argsort(-scores[survivors], kind="stable")[:leader_count]]
+    # guaranteed_lead[b, c]: b's lead over c when every open question favours c
+    guaranteed_lead = scores[leaders, None] - scores[None, survivors] + np.minimum(
+        open_rankings[leaders, None, :] - open_rankings[None, survivors, :], 0
+    ).sum(axis=2)
+    eliminated[survivors] = (guaranteed_lead > 0).any(axis=0)
+    return eliminated
+
+
+def alphabetical_ranks(contestants):
+    """Position of each contestant in sorted order, for identical-key ties."""
+    ranks = np.empty(len(contestants), dtype=np.int64)
+    ranks[sorted(range(len(contestants)), key=lambda i: contestants[i])] = np.arange(
+        len(contestants)
+    )
+    return ranks
+
+
+def block_size_for(column_count):
+    """Scenarios per block that keep a block's key matrix around 2M entries."""
+    rows = (1 << 21) // max(column_count, 1)
+    return min(DEFAULT_BLOCK_SIZE, max(256, 1 << (rows.bit_length() - 1)))
+
+
+def settle_winners(keys, key_shift, alphabetical):
+    """
+    Returns (max_scores, best_columns, at_max) for a scenarios x columns key matrix.
+
+    ``at_max`` marks every column tied on the top score; ``best_columns`` is
+    the winner after tie-breaking by the composite key, and by
+    ``alphabetical`` (each column's ``alphabetical_ranks``) for identical keys.
+    """
+    scores = keys >> key_shift
+    max_scores = scores.max(axis=1)
+    at_max = scores == max_scores[:, None]
+
+    at_best = keys == keys.max(axis=1)[:, None]
+    best = at_best.argmax(axis=1)
+    # identical correct rankings: first alphabetically, as in tie_breaker
+    identical = np.flatnonzero(at_best.sum(axis=1) > 1)
+    if len(identical):
+        best[identical] = np.where(
+            at_best[identical], alphabetical, np.iinfo(np.int64).max
+        ).argmin(axis=1)
+    return max_scores, best, at_max
+
+
+class BlockScorer:
+    """
+    Scores whole blocks of scenarios at once with numpy.
+
+    The contestants x questions ranking matrix is built once. Scenario ``i``
+    is numbered the same way as in ``winners_optimized``: the binary digits
+    of ``i``, most significant first, fill in the unresolved questions.
+
+    Contestants who provably can't reach the top score are dropped up front;
+    ``live`` holds the indices of the rest, and key/score blocks only have
+    columns for them. Winner indices and ``at_max`` cover everyone.
+    """
+
+    def __init__(self, predictions_dict, outcomes):
+        self.predictions = predictions_dict
+        self.contestants = list(predictions_dict)
+        self.outcomes = list(outcomes)
+
+        rankings = ranking_matrix(predictions_dict, len(self.outcomes))
+        is_yes = np.array([outcome == "y" for outcome in self.outcomes])
+        self.unresolved_indices = [
+            i for i, outcome in enumerate(self.outcomes) if outcome == "m"
+        ]
+        self.unresolved_count = len(self.unresolved_indices)
+        self.total_scenarios = 2**self.unresolved_count
+
+        self.live = np.flatnonzero(~eliminated_contestants(rankings, self.outcomes))
+
+        # keys already banked from resolved "y" questions, live contestants only
+        key_contributions, self.key_shift = tie_break_key_contributions(rankings)
+        key_contributions = key_contributions[self.live]
+        self.base_keys = key_contributions[:, is_yes].sum(axis=1)
+        # live contestants x unresolved questions
+        self.unresolved_keys = key_contributions[:, self.unresolved_indices]
+        # plain points, for the per-block score bounds in block_candidates
+        self.base_scores = self.base_keys >> self.key_shift
+        self.unresolved_rankings = self.unresolved_keys >> self.key_shift
+        self.block_size = block_size_for(len(self.live))
+        self.alphabetical_ranks = alphabetical_ranks(self.contestants)[self.live]
+        # bit shift that extracts each unresolved question from a scenario number
+        self.shifts = np.arange(self.unresolved_count - 1, -1, -1, dtype=np.int64)
+
+    def outcome_bits(self, start, end):
+        """Scenarios x unresolved questions matrix of 1 (yes) / 0 (no)."""
+        scenario_numbers = np.arange(start, end, dtype=np.int64)
+        return (scenario_numbers[:, None] >> self.shifts) & 1
+
+    def set_probabilities(self, probabilities, low_count=16):
+        """
+        Prepares ``scenario_weights`` for per-question chances of a yes.
+
+        A scenario's log-probability splits into its high bits (the leading
+        unresolved questions) and its ``low_count`` low bits. The low part
+        comes from a table built once here; the high part is summed once per
+        distinct prefix in a block, so each scenario costs one add.
+        """
+        probabilities = np.array(probabilities, dtype=np.float64)
+        if len(probabilities) != self.unresolved_count:
+            raise ValueError("need one probability per unresolved question")
+        with np.errstate(divide="ignore"):
+            log_yes = np.log(probabilities)
+            log_no = np.log1p(-probabilities)
+
+        self.low_count = min(low_count, self.unresolved_count)
+        high_count = self.unresolved_count - self.low_count
+        self.high_log_yes, self.high_log_no = log_yes[:high_count], log_no[:high_count]
+        low_bits = self.outcome_bits(0, 2**self.low_count)[:, high_count:]
+        self.low_log_weights = np.where(low_bits, log_yes[high_count:], log_no[high_count:]).sum(
+            axis=1
+        )
+
+    def scenario_weights(self, start, end):
+        """Probability of each scenario in [start, end) under ``set_probabilities``."""
+        scenario_numbers = np.arange(start, end, dtype=np.int64)
+        low_mask = (1 << self.low_count) - 1
+        log_weights = self.low_log_weights[scenario_numbers & low_mask]
+
+        high_shifts = np.arange(len(self.high_log_yes) - 1, -1, -1)
+        prefixes = scenario_numbers >> self.low_count
+        for prefix in range(int(prefixes[0]), int(prefixes[-1]) + 1):
+            prefix_bits = (prefix >> high_shifts) & 1
+            prefix_log_weight = np.where(prefix_bits, self.high_log_yes, self.high_log_no).sum()
+            log_weights[prefixes == prefix] += prefix_log_weight
+        return np.exp(log_weights)
+
+    def key_block(self, bits):
+        """Scenarios x live contestants matrix of composite (score, tie-break) keys."""
+        return self.base_keys + bits @ self.unresolved_keys.T
+
+    def score_block(self, bits):
+        """Scenarios x live contestants matrix of total points."""
+        return self.key_block(bits) >> self.key_shift
+
+    def winners_block(self, start, end):
+        """
+        Returns (bits, max_scores, winner_indices, at_max) for [start, end).
+
+        ``at_max`` is the scenarios x contestants boolean matrix of everyone
+        tied on the top score. Ties are settled by the composite key, the same
+        way ``tie_breaker`` would.
+        """
+        return self.winners_for_bits(self.outcome_bits(start, end))
+
+    def block_candidates(self, bits, leader_count=32):
+        """
+        Splits a block into (rows, live columns that can top those rows).
+
+        Questions that go the same way in every scenario of the block are
+        fixed. Rows are grouped by how many of the other questions came
+        true, and a contestant's best case with k of them is their k
+        highest rankings among those questions. The ``leader_count``
+        contestants with the best bounds are scored exactly; the lowest of
+        their per-row best within a group is a floor under that group's top
+        score, so anyone whose best case is below it is skipped unscored.
+        """
+        lowest_bits, highest_bits = bits.min(axis=0), bits.max(axis=0)
+        varies = lowest_bits != highest_bits
+        lowest = self.base_scores + self.unresolved_rankings[:, lowest_bits == 1].sum(axis=1)
+        open_rankings = self.unresolved_rankings[:, varies]
+        # best_case[c, k]: c's score with the k questions best for c coming true
+        best_case = np.zeros((len(lowest), open_rankings.shape[1] + 1), dtype=np.int64)
+        np.cumsum(-np.sort(-open_rankings, axis=1), axis=1, out=best_case[:, 1:])
+        best_case += lowest[:, None]
+
+        leaders = np.argsort(-(lowest + best_case[:, -1]), kind="stable")[:leader_count]
+        leader_scores = self.base_scores[leaders] + bits @ self.unresolved_rankings[leaders].T
+        leader_best = leader_scores.max(axis=1)
+        yes_counts = bits[:, varies].sum(axis=1)
+        for yes_count in np.unique(yes_counts):
+            rows = np.flatnonzero(yes_counts == yes_count)
+            floor = leader_best[rows].min()
+            yield rows, np.flatnonzero(best_case[:, yes_count] >= floor)
+
+    def winners_for_bits(self, bits):
+        """``winners_block`` for an arbitrary scenarios x unresolved 0/1 matrix."""
+        max_scores = np.empty(len(bits), dtype=np.int64)
+        winner_indices = np.empty(len(bits), dtype=np.int64)
+        at_max = np.zeros((len(bits), len(self.contestants)), dtype=bool)
+        for rows, candidates in self.block_candidates(bits):
+            keys = self.base_keys[candidates] + bits[rows] @ self.unresolved_keys[candidates].T
+            max_scores[rows], best, tied = settle_winners(
+                keys, self.key_shift, self.alphabetical_ranks[candidates]
+            )
+            at_max[np.ix_(rows, self.live[candidates])] = tied
+            winner_indices[rows] = self.live[candidates[best]]
+
+        return bits, max_scores, winner_indices, at_max
+
+    def blocks(self, start=0, end=None, block_size=None):
+        """
+        Yields (block_start, bits, max_scores, winner_indices, at_max).
+
+        Blocks default to ``self.block_size`` scenarios, which shrinks as the
+        field grows; smaller blocks also fix more leading questions, which
+        lets ``block_candidates`` skip more contestants.
+        """
+        if end is None:
+            end = self.total_scenarios
+        block_size = block_size or self.block_size
+        for block_start in range(start, end, block_size):
+            block_end = min(block_start + block_size, end)
+            yield (block_start, *self.winners_block(block_start, block_end))
+
+
+class SplitTableScorer(BlockScorer):
+    """
+    ``BlockScorer`` that adds two precomputed partial-key tables instead of
+    multiplying.
+
+    The unresolved questions split into a high half (the leading ones) and
+    a low half. ``high_table[h]`` and ``low_table[l]`` hold every live
+    contestant's key from each half, resolved "y" questions included in the
+    high table, so scenario ``(h << low_half) | l`` is their sum. A block
+    is one high row broadcast against the low table: one add per contestant
+    and scenario.
+    """
+
+    # largest low table, in entries, before falling back to BlockScorer
+    MAX_TABLE_ENTRIES = 1 << 22
+
+    def __init__(self, predictions_dict, outcomes):
+        super().__init__(predictions_dict, outcomes)
+        self.low_half = (self.unresolved_count + 1) // 2
+        high_count = self.unresolved_count - self.low_half
+        high_shifts = np.arange(high_count - 1, -1, -1, dtype=np.int64)
+        high_bits = (np.arange(2**high_count, dtype=np.int64)[:, None] >> high_shifts) & 1
+        self.high_table = self.base_keys + high_bits @ self.unresolved_keys[:, :high_count].T
+        low_bits = self.outcome_bits(0, 2**self.low_half)[:, high_count:]
+        self.low_table = low_bits @ self.unresolved_keys[:, high_count:].T
+        self.block_size = 2**self.low_half
+
+    @classmethod
+    def suits(cls, predictions_dict, outcomes):
+        """True for 20-30 unresolved questions and a field small enough for the tables."""
+        unresolved_count = list(outcomes).count("m")
+        low_entries = 2 ** ((unresolved_count + 1) // 2) * len(predictions_dict)
+        return 20 <= unresolved_count <= 30 and low_entries <= cls.MAX_TABLE_ENTRIES
+
+    def winners_block(self, start, end):
+        """Same as ``BlockScorer.winners_block``, from the two tables."""
+        low_mask = self.block_size - 1
+        if start >> self.low_half == (end - 1) >> self.low_half:
+            keys = self.high_table[start >> self.low_half] + self.low_table[
+                start & low_mask : ((end - 1) & low_mask) + 1
+            ]
+        else:
+            scenario_numbers = np.arange(start, end, dtype=np.int64)
+            keys = (
+                self.high_table[scenario_numbers >> self.low_half]
+                + self.low_table[scenario_numbers & low_mask]
+            )
+
+        max_scores, best, tied = settle_winners(keys, self.key_shift, self.alphabetical_ranks)
+        at_max = np.zeros((end - start, len(self.contestants)), dtype=bool)
+        at_max[:, self.live] = tied
+        return self.outcome_bits(start, end), max_scores, self.live[best], at_max
+
+    def blocks(self, start=0, end=None, block_size=None):
+        """``BlockScorer.blocks``, cut at high-row boundaries so each block broadcasts."""
+        if end is None:
+            end = self.total_scenarios
+        block_size = block_size or self.block_size
+        block_start = start
+        while block_start < end:
+            row_end = ((block_start >> self.low_half) + 1) << self.low_half
+            block_end = min(block_start + block_size, row_end, end)
+            yield (block_start, *self.winners_block(block_start, block_end))
+            block_start = block_end
+
+
+def block_scorer(predictions, outcomes):
+    """The default scorer: split tables for 20-30 unresolved questions, else ``BlockScorer``."""
+    if SplitTableScorer.suits(predictions, outcomes):
+        return SplitTableScorer(predictions, outcomes)
+    return BlockScorer(predictions, outcomes)
+
+
+def vectorized_winners(predictions, outcomes):
+    """Serial ``BlockScorer`` pass over every scenario."""
+    return winners_chunk(predictions, outcomes, 0, 2 ** outcomes.count("m"))
+
+
+def gray_code_winners(predictions, outcomes, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Same results as ``parallel_winners``, enumerated in Gray-code order.
+
+    Consecutive Gray codes differ in exactly one bit, so each step flips a
+    single unresolved question and moves every contestant's running score
+    by that question's ranking instead of re-scoring from scratch. The
+    running values are the composite keys from
+    ``tie_break_key_contributions``, so ties need no extra work either.
+
+    Each step only records its scenario number, winner and any tie; every
+    ``block_size`` steps the rows are folded in with one ``add_block``
+    rather than a per-scenario ``add_scenario``.
+    """
+    stats = ScenarioStats(predictions, outcomes)
+    contestants = stats.contestants
+    unresolved_indices = stats.unresolved_indices
+    unresolved_count = len(unresolved_indices)
+    rankings = ranking_matrix(predictions, len(outcomes))
+    live = np.flatnonzero(~eliminated_contestants(rankings, outcomes))
+    key_contributions, key_shift = tie_break_key_contributions(rankings)
+    key_contributions = key_contributions[live]
+    alphabetical = alphabetical_ranks(contestants)[live].tolist()
+    live_indices = live
+    live = live.tolist()
+
+    # start from the all-"n" scenario (Gray code 0)
+    is_yes = [outcome == "y" for outcome in outcomes]
+    keys = key_contributions[:, is_yes].sum(axis=1).tolist()
+    # bit b of the scenario number is unresolved question (count - 1 - b)
+    columns = [
+        key_contributions[:, unresolved_indices[unresolved_count - 1 - bit]].tolist()
+        for bit in range(unresolved_count)
+    ]
+    shifts = np.arange(unresolved_count - 1, -1, -1, dtype=np.int64)
+
+    def flush(scenario_numbers, winners, tie_rows, tie_columns):
+        bits = (np.array(scenario_numbers, dtype=np.int64)[:, None] >> shifts) & 1
+        winners = np.array(winners, dtype=np.intp)
+        at_max = np.zeros((len(winners), len(contestants)), dtype=bool)
+        at_max[np.arange(len(winners)), live_indices[winners]] = True
+        at_max[tie_rows, live_indices[tie_columns]] = True
+        stats.add_block(bits, live_indices[winners], at_max)
+
+    scenario_numbers, winners, tie_rows, tie_columns = [], [], [], []
+    code = 0
+    for step in range(2**unresolved_count):
+        if step:
+            bit = (step & -step).bit_length() - 1
+            code ^= 1 << bit
+            if code >> bit & 1:
+                keys = [k + c for k, c in zip(keys, columns[bit])]
+            else:
+                keys = [k - c for k, c in zip(keys, columns[bit])]
+
+        best_key = max(keys)
+        max_points = best_key >> key_shift
+        tied = [i for i, k in enumerate(keys) if k >> key_shift == max_points]
+
+        if len(tied) == 1:
+            winner = tied[0]
+        else:
+            # identical correct rankings: first alphabetically, as in tie_breaker
+            winner = min(
+                (i for i in tied if keys[i] == best_key), key=alphabetical.__getitem__
+            )
+            tie_rows.extend([len(winners)] * len(tied))
+            tie_columns.extend(tied)
+
+        scenario_numbers.append(code)
+        winners.append(winner)
+        if len(winners) == block_size:
+            flush(scenario_numbers, winners, tie_rows, tie_columns)
+            scenario_numbers, winners, tie_rows, tie_columns = [], [], [], []
+
+    if winners:
+        flush(scenario_numbers, winners, tie_rows, tie_columns)
+    return stats
+
+
+class ByteTableScorer:
+    """
+    Composite keys from 256-entry lookup tables over scenario numbers.
+
+    Byte b of a scenario number holds bits 8b..8b+7, up to eight unresolved
+    questions (bit j is unresolved question count - 1 - j, as in
+    ``winners_optimized``). ``tables[b][v, c]`` is live contestant c's key
+    from the questions set in byte value v, so a contestant's key for a
+    scenario is ``base_keys[c]`` plus one lookup per byte: four lookups for
+    up to 32 unresolved questions. ``keys`` does this for one scenario in
+    pure Python; ``key_block`` gathers a whole array of scenario numbers.
+    """
+
+    def __init__(self, predictions_dict, outcomes):
+        self.contestants = list(predictions_dict)
+        self.outcomes = list(outcomes)
+
+        rankings = ranking_matrix(predictions_dict, len(self.outcomes))
+        is_yes = np.array([outcome == "y" for outcome in self.outcomes])
+        self.unresolved_indices = [
+            i for i, outcome in enumerate(self.outcomes) if outcome == "m"
+        ]
+        self.unresolved_count = len(self.unresolved_indices)
+        self.total_scenarios = 2**self.unresolved_count
+
+        self.live = np.flatnonzero(~eliminated_contestants(rankings, self.outcomes))
+        key_contributions, self.key_shift = tie_break_key_contributions(rankings)
+        key_contributions = key_contributions[self.live]
+        self.base_keys = key_contributions[:, is_yes].sum(axis=1)
+        self.alphabetical_ranks = alphabetical_ranks(self.contestants)[self.live]
+        self.block_size = block_size_for(len(self.live))
+
+        # live contestants x scenario-number bits, lowest bit first
+        self.byte_count = max(1, -(-self.unresolved_count // 8))
+        bit_keys = np.zeros((len(self.live), 8 * self.byte_count), dtype=np.int64)
+        bit_keys[:, : self.unresolved_count] = key_contributions[:, self.unresolved_indices[::-1]]
+        byte_values = (np.arange(256)[:, None] >> np.arange(8)) & 1
+        self.tables = np.stack(
+            [byte_values @ bit_keys[:, 8 * b : 8 * b + 8].T for b in range(self.byte_count)]
+        )
+        # the same tables as lists of rows, for one scenario at a time
+        self.base_key_list = self.base_keys.tolist()
+        self.table_rows = [table.tolist() for table in self.tables]
+
+    def keys(self, scenario_number):
+        """Composite keys of the live contestants for one scenario, in pure Python."""
+        rows = [
+            table[scenario_number >> 8 * b & 255] for b, table in enumerate(self.table_rows)
+        ]
+        return [sum(column) for column in zip(self.base_key_list, *rows)]
+
+    def winner(self, scenario_number):
+        """Returns (winner_index, tied_indices) for one scenario, in pure Python."""
+        keys = self.keys(scenario_number)
+        best_key = max(keys)
+        max_points = best_key >> self.key_shift
+        tied = [i for i, k in enumerate(keys) if k >> self.key_shift == max_points]
+        # identical correct rankings: first alphabetically, as in tie_breaker
+        winner = min(
+            (i for i in tied if keys[i] == best_key), key=self.alphabetical_ranks.__getitem__
+        )
+        return int(self.live[winner]), self.live[tied].tolist()
+
+    def key_block(self, scenario_numbers):
+        """Scenarios x live contestants key matrix, gathered from the byte tables."""
+        scenario_numbers = np.asarray(scenario_numbers, dtype=np.int64)
+        keys = self.base_keys + self.tables[0][scenario_numbers & 255]
+        for b in range(1, self.byte_count):
+            keys += self.tables[b][scenario_numbers >> 8 * b & 255]
+        return keys
+
+    def winners_block(self, start, end):
+        """Same as ``BlockScorer.winners_block``, scored by table lookups."""
+        scenario_numbers = np.arange(start, end, dtype=np.int64)
+        shifts = np.arange(self.unresolved_count - 1, -1, -1, dtype=np.int64)
+        bits = (scenario_numbers[:, None] >> shifts) & 1
+
+        max_scores, best, tied = settle_winners(
+            self.key_block(scenario_numbers), self.key_shift, self.alphabetical_ranks
+        )
+        at_max = np.zeros((len(bits), len(self.contestants)), dtype=bool)
+        at_max[:, self.live] = tied
+        return bits, max_scores, self.live[best], at_max
+
+
+def byte_table_winners(predictions, outcomes):
+    """Serial pass over every scenario, scored with ``ByteTableScorer`` lookups."""
+    scorer = ByteTableScorer(predictions, outcomes)
+    stats = ScenarioStats(predictions, outcomes)
+    for start in range(0, scorer.total_scenarios, scorer.block_size):
+        end = min(start + scorer.block_size, scorer.total_scenarios)
+        bits, _max_scores, winner_indices, at_max = scorer.winners_block(start, end)
+        stats.add_block(bits, winner_indices, at_max)
+    return stats
+
+
+class BitSlices:
+    """
+    Bit-sliced arithmetic over the 2**k scenarios of one chunk.
+
+    Scenario s of the chunk (its last ``k`` unresolved questions set to the
+    binary digits of s, most significant first) is bit s of a Python int,
+    so one int operation covers every scenario in the chunk. A number that
+    differs by scenario, such as a composite key, is a list of those ints,
+    one per binary digit, lowest digit first.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.size = 1 << k
+        self.all = (1 << self.size) - 1
+        # scenarios where each of the k questions is yes, most significant first
+        self.question_masks = [self.digit_mask(k - 1 - i) for i in range(k)]
+        # scenarios with exactly j of the k questions yes
+        yes_counts = np.bitwise_count(np.arange(self.size, dtype=np.int64))
+        self.yes_count_masks = [self.from_flags(yes_counts == j) for j in range(k + 1)]
+
+    def digit_mask(self, digit):
+        """Scenarios whose number has binary digit ``digit`` set."""
+        run = 1 << digit
+        pattern = ((1 << run) - 1) << run
+        # repeat the 2*run-bit pattern across the whole chunk
+        return pattern * (self.all // ((1 << 2 * run) - 1))
+
+    @staticmethod
+    def from_flags(flags):
+        """Mask with bit s set where ``flags[s]`` is true."""
+        return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+    def constant(self, value, width):
+        """``value`` in every scenario, as ``width`` digits."""
+        return [self.all if value >> digit & 1 else 0 for digit in range(width)]
+
+    def add(self, first, second):
+        """Ripple-carry sum of two numbers of the same width; overflow is dropped."""
+        total = []
+        carry = 0
+        for a, b in zip(first, second):
+            partial = a ^ b
+            total.append(partial ^ carry)
+            carry = (a & b) | (carry & partial)
+        return total
+
+    def greater(self, first, second):
+        """Scenarios where ``first`` > ``second``, comparing from the top digit."""
+        greater = 0
+        equal = self.all
+        for a, b in zip(reversed(first), reversed(second)):
+            greater |= equal & a & ~b
+            equal &= ~(a ^ b)
+        return greater
+
+    def equal(self, first, second):
+        """Scenarios where the two numbers match digit for digit."""
+        equal = self.all
+        for a, b in zip(first, second):
+            equal &= ~(a ^ b)
+        return equal
+
+    def select(self, mask, first, second):
+        """``first`` in the scenarios in ``mask``, ``second`` elsewhere."""
+        return [(a & mask) | (b & ~mask) for a, b in zip(first, second)]
+
+
+def bit_sliced_winners(predictions, outcomes, chunk_bits=16):
+    """
+    Same results as ``vectorized_winners``, 2**chunk_bits scenarios per int op.
+
+    The last ``chunk_bits`` unresolved questions form a ``BitSlices`` chunk.
+    Each live contestant's composite key over the chunk is summed once with
+    ripple-carry adders from one yes-mask per question; every run through
+    the leading questions then adds a constant, takes the max with bitwise
+    comparators and reads the counters off the masks with ``int.bit_count``.
+    """
+    stats = ScenarioStats(predictions, outcomes)
+    contestants = stats.contestants
+    unresolved_indices = stats.unresolved_indices
+    rankings = ranking_matrix(predictions, len(outcomes))
+    is_yes = np.array([outcome == "y" for outcome in outcomes])
+    live = np.flatnonzero(~eliminated_contestants(rankings, outcomes))
+    key_contributions, key_shift = tie_break_key_contributions(rankings)
+    key_contributions = key_contributions[live]
+
+    k = min(chunk_bits, len(unresolved_indices))
+    fixed_count = len(unresolved_indices) - k
+    slices = BitSlices(k)
+    base_keys = key_contributions[:, is_yes].sum(axis=1)
+    fixed_keys = key_contributions[:, unresolved_indices[:fixed_count]]
+    free_keys = key_contributions[:, unresolved_indices[fixed_count:]].tolist()
+    highest_keys = base_keys + key_contributions[:, unresolved_indices].sum(axis=1)
+    width = int(highest_keys.max()).bit_length()
+
+    free_sums = []
+    for contributions in free_keys:
+        key = slices.constant(0, width)
+        for question, contribution in zip(slices.question_masks, contributions):
+            key = slices.add(key, [question if contribution >> d & 1 else 0 for d in range(width)])
+        free_sums.append(key)
+    # identical keys go to the first alphabetically, as in tie_breaker
+    alphabetical_order = np.argsort(alphabetical_ranks(contestants)[live]).tolist()
+    fixed_shifts = np.arange(fixed_count - 1, -1, -1)
+
+    for prefix in range(2**fixed_count):
+        fixed_bits = (prefix >> fixed_shifts) & 1
+        prefix_keys = (base_keys + fixed_keys @ fixed_bits).tolist()
+        keys = [
+            slices.add(free_sum, slices.constant(prefix_key, width))
+            for free_sum, prefix_key in zip(free_sums, prefix_keys)
+        ]
+        best = keys[0]
+        for key in keys[1:]:
+            best = slices.select(slices.greater(key, best), key, best)
+
+        at_max_masks = {}
+        seen = tie_mask = 0
+        for column, key in enumerate(keys):
+            mask = slices.equal(key[key_shift:], best[key_shift:])
+            if mask:
+                at_max_masks[column] = mask
+                tie_mask |= seen & mask
+                seen |= mask
+        winner_masks = {}
+        unclaimed = slices.all
+        for column in alphabetical_order:
+            if column in at_max_masks:
+                mask = at_max_masks[column] & unclaimed
+                mask &= slices.equal(keys[column][:key_shift], best[:key_shift])
+                if mask:
+                    winner_masks[int(live[column])] = mask
+                    unclaimed &= ~mask
+
+        at_max_masks = {int(live[column]): mask for column, mask in at_max_masks.items()}
+        stats.add_masks(fixed_bits, slices, winner_masks, at_max_masks, tie_mask)
+    return stats
+
+
+def packed_bitsets(matrix):
+    """Packs a scenarios x columns 0/1 matrix into one uint64 bitset row per column."""
+    packed = np.packbits(np.asarray(matrix, dtype=bool), axis=0)
+    packed = np.pad(packed, ((0, -len(packed) % 8), (0, 0)))
+    return np.ascontiguousarray(packed.T).view(np.uint64)
+
+
+def overlap_counts(first, second):
+    """
+    Columns of ``first`` x columns of ``second``: scenarios set in both.
+
+    Each column becomes a bitset over the block's scenarios, so a count is
+    the popcount of two bitsets ANDed together.
+    """
+    first_sets = packed_bitsets(first)
+    second_sets = packed_bitsets(second)
+    return np.bitwise_count(first_sets[:, None, :] & second_sets[None, :, :]).sum(
+        axis=2, dtype=np.int64
+    )
+
+
+class ScenarioStats:
+    """
+    Per-contestant counters folded from scored scenarios.
+
+    Everything is a plain sum over scenarios, so stats for separate scenario
+    ranges can be merged in any order. With ``weighted`` the counters are
+    floats and each scenario adds its probability instead of 1.
+    """
+
+    def __init__(self, contestants, outcomes, weighted=False):
+        self.contestants = list(contestants)
+        self.outcomes = list(outcomes)
+        self.unresolved_indices = [
+            i for i, outcome in enumerate(self.outcomes) if outcome == "m"
+        ]
+        self.resolved_yes = [i for i, outcome in enumerate(self.outcomes) if outcome == "y"]
+        self.resolved_no = [i for i, outcome in enumerate(self.outcomes) if outcome == "n"]
+        contestant_count = len(self.contestants)
+        dtype = np.float64 if weighted else np.int64
+
+        self.total = 0.0 if weighted else 0
+        # counters come from random draws, not every scenario once (monte_carlo_winners)
+        self.sampled = False
+        # scenarios where more than one contestant had the top score
+        self.tie_scenarios = 0.0 if weighted else 0
+        # winner after tie-breaking
+        self.winner_tally = np.zeros(contestant_count, dtype=dtype)
+        # won outright, no tie-breaker needed
+        self.direct_wins = np.zeros(contestant_count, dtype=dtype)
+        # tie scenarios this contestant was part of
+        self.tie_participation = np.zeros(contestant_count, dtype=dtype)
+        # won outright or tied for the top score
+        self.win_or_tie_tally = np.zeros(contestant_count, dtype=dtype)
+        # contestants x questions x (yes, no), over win-or-tie scenarios
+        self.question_buckets = np.zeros(
+            (contestant_count, len(self.outcomes), 2), dtype=dtype
+        )
+        # contestants x how many more "yes" outcomes, over win-or-tie scenarios
+        self.yes_buckets = np.zeros(
+            (contestant_count, len(self.unresolved_indices) + 1), dtype=dtype
+        )
+        # contestants x unresolved x unresolved: wins with both questions yes
+        # (the diagonal is wins with that one question yes); see ``what_if``
+        unresolved_count = len(self.unresolved_indices)
+        self.pair_yes_wins = np.zeros(
+            (contestant_count, unresolved_count, unresolved_count), dtype=dtype
+        )
+
+    def add_block(self, bits, winner_indices, at_max, weights=None):
+        """
+        Folds in a block scored by ``BlockScorer.winners_block``.
+
+        ``weights`` gives each scenario's probability for weighted stats.
+        """
+        contestant_count = len(self.contestants)
+        was_tie = at_max.sum(axis=1) > 1
+        # only contestants who top some scenario of the block have counts to add
+        people = np.flatnonzero(at_max.any(axis=0))
+        at_max = at_max[:, people]
+        # the winner always has the top score, so at_max is winner-or-tied
+        if weights is None:
+            participation = at_max.astype(np.int64)
+            self.total += len(winner_indices)
+            self.tie_scenarios += int(was_tie.sum())
+        else:
+            participation = at_max * weights[:, None]
+            self.total += weights.sum()
+            self.tie_scenarios += weights[was_tie].sum()
+        block_participation = participation.sum(axis=0)
+
+        self.winner_tally += np.bincount(
+            winner_indices, weights, minlength=contestant_count
+        ).astype(self.winner_tally.dtype)
+        self.direct_wins += np.bincount(
+            winner_indices[~was_tie],
+            None if weights is None else weights[~was_tie],
+            minlength=contestant_count,
+        ).astype(self.direct_wins.dtype)
+        self.tie_participation[people] += participation[was_tie].sum(axis=0)
+        self.win_or_tie_tally[people] += block_participation
+
+        if weights is None:
+            # win-or-tie set of each contestant AND yes set of each question
+            yes_counts = overlap_counts(at_max, bits)
+        else:
+            yes_counts = participation.T @ bits
+        buckets = self.question_buckets[people]
+        buckets[:, self.unresolved_indices, 0] += yes_counts
+        buckets[:, self.unresolved_indices, 1] += block_participation[:, None] - yes_counts
+        buckets[:, self.resolved_yes, 0] += block_participation[:, None]
+        buckets[:, self.resolved_no, 1] += block_participation[:, None]
+        self.question_buckets[people] = buckets
+
+        # one bincount over (contestant, bit count of the scenario) for every
+        # win-or-tie pair in the block
+        more_yes = bits.sum(axis=1)
+        scenario_rows, columns = np.nonzero(at_max)
+        bucket_count = self.yes_buckets.shape[1]
+        self.yes_buckets[people] += (
+            np.bincount(
+                columns * bucket_count + more_yes[scenario_rows],
+                None if weights is None else weights[scenario_rows],
+                minlength=len(people) * bucket_count,
+            )
+            .reshape(len(people), bucket_count)
+            .astype(self.yes_buckets.dtype)
+        )
+
+        # float products go through BLAS and stay exact for integer counts
+        float_bits = bits.astype(np.float64)
+        weighted_bits = float_bits if weights is None else float_bits * weights[:, None]
+        for person in np.unique(winner_indices):
+            rows = winner_indices == person
+            self.pair_yes_wins[person] += (weighted_bits[rows].T @ float_bits[rows]).astype(
+                self.pair_yes_wins.dtype
+            )
+
+    def add_scenario(self, outcome, winner_index, tied_indices):
+        """Folds in one scenario given its full y/n outcome string."""
+        was_tie = len(tied_indices) > 1
+        self.total += 1
+        self.winner_tally[winner_index] += 1
+        if was_tie:
+            self.tie_scenarios += 1
+            self.tie_participation[tied_indices] += 1
+        else:
+            self.direct_wins[winner_index] += 1
+        self.win_or_tie_tally[tied_indices] += 1
+
+        is_no = np.array([event == "n" for event in outcome], dtype=np.intp)
+        self.question_buckets[
+            np.array(tied_indices)[:, None], np.arange(len(outcome)), is_no
+        ] += 1
+        more_yes = outcome.count("y") - len(self.resolved_yes)
+        self.yes_buckets[tied_indices, more_yes] += 1
+
+        is_yes = np.array([outcome[idx] == "y" for idx in self.unresolved_indices], dtype=bool)
+        self.pair_yes_wins[winner_index] += np.outer(is_yes, is_yes)
+
+    def add_subtree(self, winner_index, fixed_bits, free_count):
+        """
+        Credits all 2**free_count scenarios below a branch to one outright winner.
+
+        ``fixed_bits`` are the 0/1 values of the leading unresolved questions;
+        the remaining ``free_count`` take every combination, so each is yes in
+        exactly half of the subtree.
+        """
+        subtree_size = 2**free_count
+        self.total += subtree_size
+        self.winner_tally[winner_index] += subtree_size
+        self.direct_wins[winner_index] += subtree_size
+        self.win_or_tie_tally[winner_index] += subtree_size
+
+        buckets = self.question_buckets[winner_index]
+        buckets[self.resolved_yes, 0] += subtree_size
+        buckets[self.resolved_no, 1] += subtree_size
+        for idx, bit in zip(self.unresolved_indices, fixed_bits):
+            buckets[idx, 0 if bit else 1] += subtree_size
+        free_indices = self.unresolved_indices[len(fixed_bits) :]
+        if free_indices:
+            buckets[free_indices, :] += subtree_size // 2
+
+        fixed_yes = sum(fixed_bits)
+        for more_yes in range(free_count + 1):
+            self.yes_buckets[winner_index, fixed_yes + more_yes] += math.comb(
+                free_count, more_yes
+            )
+
+        # a free question is yes in half the subtree, two free ones in a quarter
+        yes_share = np.array(list(fixed_bits) + [0.5] * free_count)
+        both_yes = np.outer(yes_share, yes_share)
+        np.fill_diagonal(both_yes, yes_share)
+        self.pair_yes_wins[winner_index] += (both_yes * subtree_size).astype(np.int64)
+
+    def add_group(
+        self, winner_index, tied_indices, count, unresolved_yes_counts, yes_count_distribution=None
+    ):
+        """
+        Folds in ``count`` scenarios that share a winner and tie set.
+
+        ``unresolved_yes_counts`` gives, per unresolved question, how many of
+        those scenarios have it as yes, and ``yes_count_distribution`` how
+        many have 0, 1, 2, ... more yesses. The pair table is left alone.
+        """
+        self.total += count
+        self.winner_tally[winner_index] += count
+        if len(tied_indices) > 1:
+            self.tie_scenarios += count
+            self.tie_participation[tied_indices] += count
+        else:
+            self.direct_wins[winner_index] += count
+        self.win_or_tie_tally[tied_indices] += count
+
+        yes_counts = np.array(unresolved_yes_counts, dtype=np.int64)
+        for person in tied_indices:
+            buckets = self.question_buckets[person]
+            buckets[self.unresolved_indices, 0] += yes_counts
+            buckets[self.unresolved_indices, 1] += count - yes_counts
+            buckets[self.resolved_yes, 0] += count
+            buckets[self.resolved_no, 1] += count
+        if yes_count_distribution is not None:
+            self.yes_buckets[tied_indices] += yes_count_distribution
+
+    def add_masks(self, fixed_bits, slices, winner_masks, at_max_masks, tie_mask):
+        """
+        Folds in one chunk scored by ``bit_sliced_winners``.
+
+        ``fixed_bits`` are the 0/1 values of the leading unresolved questions;
+        the last ``slices.k`` take every combination. The masks are ints over
+        the chunk's scenarios (see ``BitSlices``), keyed by contestant index.
+        """
+        fixed_count = len(fixed_bits)
+        fixed_yes = np.flatnonzero(fixed_bits)
+        free = np.arange(fixed_count, fixed_count + slices.k)
+        self.total += slices.size
+        self.tie_scenarios += tie_mask.bit_count()
+
+        for person, mask in at_max_masks.items():
+            count = mask.bit_count()
+            self.win_or_tie_tally[person] += count
+            self.tie_participation[person] += (mask & tie_mask).bit_count()
+            yes_counts = np.zeros(len(self.unresolved_indices), dtype=np.int64)
+            yes_counts[fixed_yes] = count
+            yes_counts[free] = [(mask & question).bit_count() for question in slices.question_masks]
+            buckets = self.question_buckets[person]
+            buckets[self.unresolved_indices, 0] += yes_counts
+            buckets[self.unresolved_indices, 1] += count - yes_counts
+            buckets[self.resolved_yes, 0] += count
+            buckets[self.resolved_no, 1] += count
+            self.yes_buckets[person, len(fixed_yes) : len(fixed_yes) + slices.k + 1] += [
+                (mask & yes_count).bit_count() for yes_count in slices.yes_count_masks
+            ]
+
+        for person, mask in winner_masks.items():
+            count = mask.bit_count()
+            self.winner_tally[person] += count
+            self.direct_wins[person] += (mask & ~tie_mask).bit_count()
+            free_wins = [mask & question for question in slices.question_masks]
+            free_yes = np.array([wins.bit_count() for wins in free_wins], dtype=np.int64)
+            both_free = np.array(
+                [
+                    (wins & question).bit_count()
+                    for wins in free_wins
+                    for question in slices.question_masks
+                ],
+                dtype=np.int64,
+            ).reshape(slices.k, slices.k)
+            pairs = self.pair_yes_wins[person]
+            pairs[np.ix_(fixed_yes, fixed_yes)] += count
+            pairs[np.ix_(fixed_yes, free)] += free_yes
+            pairs[np.ix_(free, fixed_yes)] += free_yes[:, None]
+            pairs[np.ix_(free, free)] += both_free
+
+    def merge(self, other):
+        self.total += other.total
+        self.tie_scenarios += other.tie_scenarios
+        self.winner_tally += other.winner_tally
+        self.direct_wins += other.direct_wins
+        self.tie_participation += other.tie_participation
+        self.win_or_tie_tally += other.win_or_tie_tally
+        self.question_buckets += other.question_buckets
+        self.yes_buckets += other.yes_buckets
+        self.pair_yes_wins += other.pair_yes_wins
+        self.sampled = self.sampled or other.sampled
+        return self
+
+    def tie_only_contestants(self):
+        """Contestants who win some scenarios, but only ever through a tie-break."""
+        return [
+            contestant
+            for contestant, direct_wins, tie_count in zip(
+                self.contestants, self.direct_wins, self.tie_participation
+            )
+            if tie_count and direct_wins == 0
+        ]
+
+    def summary(self):
+        """Per-contestant counters as plain JSON-ready values."""
+        tie_only = set(self.tie_only_contestants())
+        return {
+            "total": self.total,
+            "tie_scenarios": self.tie_scenarios,
+            "contestants": {
+                contestant: {
+                    "wins": self.winner_tally[i].item(),
+                    "direct_wins": self.direct_wins[i].item(),
+                    "tie_participation": self.tie_participation[i].item(),
+                    "win_or_tie": self.win_or_tie_tally[i].item(),
+                    "tie_only": contestant in tie_only,
+                }
+                for i, contestant in enumerate(self.contestants)
+            },
+        }
+
+    def what_if(self, conditions):
+        """
+        Wins per contestant among scenarios matching ``conditions``.
+
+        ``conditions`` maps up to two unresolved question positions (indices
+        into ``outcomes``) to "y" or "n". Returns (wins, scenario count); the
+        answer is read off ``pair_yes_wins`` by inclusion-exclusion, with no
+        re-enumeration.
+        """
+        if len(conditions) > 2:
+            raise ValueError("what_if takes at most two questions")
+        (first, first_outcome), (second, second_outcome) = (
+            list(conditions.items()) * 2
+        )[:2]
+        i = self.unresolved_indices.index(first)
+        j = self.unresolved_indices.index(second)
+
+        both = self.pair_yes_wins[:, i, j]
+        first_yes = self.pair_yes_wins[:, i, i]
+        second_yes = self.pair_yes_wins[:, j, j]
+        wins = {
+            ("y", "y"): both,
+            ("y", "n"): first_yes - both,
+            ("n", "y"): second_yes - both,
+            ("n", "n"): self.winner_tally - first_yes - second_yes + both,
+        }[first_outcome, second_outcome]
+        # every scenario has exactly one winner
+        return wins, wins.sum()
+
+
+def winners_chunk(predictions, outcomes, start, end, probabilities=None):
+    """
+    ``ScenarioStats`` for scenarios [start, end); runs in a worker process.
+
+    With ``probabilities`` (chance of yes per unresolved question) each
+    scenario is weighted by how likely it is.
+    """
+    scorer = block_scorer(predictions, outcomes)
+    stats = ScenarioStats(scorer.contestants, outcomes, probabilities is not None)
+    if probabilities is not None:
+        scorer.set_probabilities(probabilities)
+    for block_start, bits, _max_scores, winner_indices, at_max in scorer.blocks(
+        start, end
+    ):
+        weights = None
+        if probabilities is not None:
+            weights = scorer.scenario_weights(block_start, block_start + len(bits))
+        stats.add_block(bits, winner_indices, at_max, weights)
+    return stats
+
+
+def merge_stats(predictions, outcomes, partials, weighted=False):
+    stats = ScenarioStats(predictions, outcomes, weighted)
+    for partial in partials:
+        stats.merge(partial)
+    return stats
+
+
+class WinnerArray:
+    """
+    Per-scenario winners kept on disk and opened with mmap.
+
+    ``<path>.winners.npy`` holds one uint8 winner index per scenario number,
+    ``<path>.ties.npy`` a packed bitmap of the scenarios that needed the
+    tie-breaker, and ``<path>.meta.json`` the contestants and outcomes they
+    were computed for, with a ``rankings_digest`` of the predictions.
+    """
+
+    def __init__(self, path):
+        with open(path + ".meta.json") as f:
+            meta = json.load(f)
+        self.contestants = meta["contestants"]
+        self.outcomes = meta["outcomes"]
+        self.digest = meta.get("digest")
+        self.unresolved_indices = [
+            i for i, outcome in enumerate(self.outcomes) if outcome == "m"
+        ]
+        self.winners = np.load(path + ".winners.npy", mmap_mode="r")
+        self.ties = np.load(path + ".ties.npy", mmap_mode="r")
+
+    @staticmethod
+    def rankings_digest(predictions_dict, question_ids=None):
+        """
+        Hash of the question ids and every contestant's rankings.
+
+        ``question_ids`` default to question positions. Any change to a
+        ranking, a name or the questions gives a different digest.
+        """
+        if question_ids is None:
+            question_ids = list(range(len(next(iter(predictions_dict.values()), []))))
+        rankings = [[name, [int(r) for r in ranks]] for name, ranks in predictions_dict.items()]
+        content = json.dumps([list(question_ids), rankings], ensure_ascii=False)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def built_for(self, predictions_dict, question_ids=None):
+        """True if the array was built from exactly these rankings."""
+        return self.digest == self.rankings_digest(predictions_dict, question_ids)
+
+    @classmethod
+    def build(
+        cls, path, predictions_dict, outcomes, block_size=DEFAULT_BLOCK_SIZE, question_ids=None
+    ):
+        scorer = BlockScorer(predictions_dict, outcomes)
+        if len(scorer.contestants) > 256:
+            raise ValueError("a uint8 winner array holds at most 256 contestants")
+        # block starts must stay byte-aligned in the packed tie bitmap
+        assert block_size % 8 == 0
+
+        total = scorer.total_scenarios
+        winners = np.lib.format.open_memmap(
+            path + ".winners.npy", mode="w+", dtype=np.uint8, shape=(total,)
+        )
+        ties = np.lib.format.open_memmap(
+            path + ".ties.npy", mode="w+", dtype=np.uint8, shape=((total + 7) // 8,)
+        )
+        for block_start, _bits, _max_scores, winner_indices, at_max in scorer.blocks(
+            block_size=block_size
+        ):
+            block_end = block_start + len(winner_indices)
+            winners[block_start:block_end] = winner_indices
+            ties[block_start // 8 : (block_end + 7) // 8] = np.packbits(
+                at_max.sum(axis=1) > 1
+            )
+        winners.flush()
+        ties.flush()
+
+        with open(path + ".meta.json", "w") as f:
+            json.dump(
+                {
+                    "contestants": scorer.contestants,
+                    "outcomes": list(outcomes),
+                    "digest": cls.rankings_digest(predictions_dict, question_ids),
+                },
+                f,
+            )
+        return cls(path)
+
+    def scenario_number(self, outcome):
+        """Scenario number of a full y/n outcome string."""
+        number = 0
+        for idx in self.unresolved_indices:
+            number = number * 2 + (outcome[idx] == "y")
+        return number
+
+    def was_tie(self, start, end):
+        offset = start % 8
+        packed = self.ties[start // 8 : (end + 7) // 8]
+        return np.unpackbits(packed)[offset : offset + end - start].astype(bool)
+
+    def lookup(self, outcome):
+        """Returns (winner, was_tie) for a full y/n outcome string."""
+        number = self.scenario_number(outcome)
+        return self.contestants[self.winners[number]], bool(self.was_tie(number, number + 1)[0])
+
+    def scenario_slice(self, outcomes):
+        """
+        Maps scenario numbers for ``outcomes`` onto this array's numbering.
+
+        ``outcomes`` may resolve questions that were still open when the
+        array was built, which just narrows it to the matching scenarios.
+        Returns (base, place_values): scenario ``i`` of ``outcomes`` lives at
+        ``base + bits(i) @ place_values``.
+        """
+        for built, current in zip(self.outcomes, outcomes):
+            if built != "m" and built != current:
+                raise ValueError("winner array was built for conflicting outcomes")
+        positions = {idx: p for p, idx in enumerate(reversed(self.unresolved_indices))}
+        base = sum(1 << positions[idx] for idx in self.unresolved_indices if outcomes[idx] == "y")
+        place_values = np.array(
+            [1 << positions[idx] for idx in self.unresolved_indices if outcomes[idx] == "m"],
+            dtype=np.int64,
+        )
+        return base, place_values
+
+    def stats(
+        self,
+        predictions_dict,
+        outcomes=None,
+        start=0,
+        end=None,
+        block_size=DEFAULT_BLOCK_SIZE,
+        question_ids=None,
+    ):
+        """
+        ``ScenarioStats`` read straight off the mapped arrays.
+
+        With ``outcomes`` only the slice of scenarios that agrees with them
+        is read (see ``scenario_slice``), so resolving or un-resolving a
+        question needs no re-scoring. ``start``/``end`` count scenarios of
+        that slice. Only scenarios flagged as ties are re-scored, to recover
+        everyone who shared the top score.
+        """
+        if list(predictions_dict) != self.contestants:
+            raise ValueError("winner array was built for different contestants")
+        if not self.built_for(predictions_dict, question_ids):
+            raise ValueError("winner array was built for different rankings or questions")
+        outcomes = list(self.outcomes if outcomes is None else outcomes)
+        base, place_values = self.scenario_slice(outcomes)
+        scorer = BlockScorer(predictions_dict, outcomes)
+        stats = ScenarioStats(self.contestants, outcomes)
+        if end is None:
+            end = scorer.total_scenarios
+
+        for block_start in range(start, end, block_size):
+            block_end = min(block_start + block_size, end)
+            bits = scorer.outcome_bits(block_start, block_end)
+            if len(place_values) == len(self.unresolved_indices):
+                numbers = np.arange(block_start, block_end)
+                winner_indices = self.winners[block_start:block_end].astype(np.intp)
+                was_tie = self.was_tie(block_start, block_end)
+            else:
+                numbers = base + bits @ place_values
+                winner_indices = self.winners[numbers].astype(np.intp)
+                was_tie = (self.ties[numbers >> 3] >> (7 - (numbers & 7))) & 1 == 1
+
+            at_max = np.zeros((len(numbers), len(self.contestants)), dtype=bool)
+            at_max[np.arange(len(numbers)), winner_indices] = True
+            if was_tie.any():
+                scores = scorer.score_block(bits[was_tie])
+                at_max[np.ix_(was_tie, scorer.live)] = scores == scores.max(
+                    axis=1, keepdims=True
+                )
+
+            stats.add_block(bits, winner_indices, at_max)
+        return stats
+
+
+def branch_and_bound_winners(predictions, outcomes, leaf_size=10):
+    """
+    Same results as ``parallel_winners``, skipping subtrees that are decided.
+
+    Unresolved questions are fixed one at a time in scenario-number order.
+    At each branch, if the current leader beats every other contestant even
+    after everything still open breaks against them, the leader wins all
+    2**k scenarios below outright and they are credited in one step. Open
+    subtrees of ``leaf_size`` questions or fewer are block-scored.
+    """
+    scorer = BlockScorer(predictions, outcomes)
+    stats = ScenarioStats(scorer.contestants, outcomes)
+    unresolved_count = scorer.unresolved_count
+    rankings = scorer.unresolved_keys >> scorer.key_shift
+
+    # leader_gaps[a][d, b]: minus the most b can still gain on a from question
+    # d onwards; built per contestant the first time they lead, so memory is
+    # leaders x live x questions instead of live x live x questions
+    leader_gaps = {}
+
+    def worst_gaps(leader):
+        if leader not in leader_gaps:
+            gains = np.minimum(rankings[leader] - rankings, 0)
+            gaps = np.zeros((unresolved_count + 1, len(rankings)), dtype=np.int64)
+            gaps[:-1] = np.cumsum(gains[:, ::-1], axis=1)[:, ::-1].T
+            leader_gaps[leader] = gaps
+        return leader_gaps[leader]
+
+    def descend(depth, fixed_bits, keys):
+        free_count = unresolved_count - depth
+        scores = keys >> scorer.key_shift
+        leader = int(scores.argmax())
+        margins = scores[leader] - scores + worst_gaps(leader)[depth]
+        margins[leader] = 1
+        if margins.min() > 0:
+            stats.add_subtree(scorer.live[leader], fixed_bits, free_count)
+            return
+
+        if free_count <= leaf_size:
+            prefix = 0
+            for bit in fixed_bits:
+                prefix = prefix * 2 + bit
+            for _block_start, bits, _max, winner_indices, at_max in scorer.blocks(
+                prefix << free_count, (prefix + 1) << free_count
+            ):
+                stats.add_block(bits, winner_indices, at_max)
+            return
+
+        descend(depth + 1, fixed_bits + [0], keys)
+        descend(depth + 1, fixed_bits + [1], keys + scorer.unresolved_keys[:, depth])
+
+    descend(0, [], scorer.base_keys)
+    return stats
+
+
+def state_dp_winners(predictions, outcomes, order_sample=32, leaf_size=10):
+    """
+    Exact counts by dynamic programming over collapsed standings.
+
+    Unresolved questions are added one at a time. A state holds every live
+    contestant's score relative to the leader, plus the tie-break standing
+    of each pair that can still meet on score: their exact mask difference,
+    or just who is ahead once that can no longer flip (the lead is bigger
+    than everything the other can still add). Each state maps to [scenario
+    count, yes count per unresolved question]. Partial assignments that
+    reach the same state are merged, so the work scales with the number of
+    distinct states. Contestants who can no longer catch the leader, or
+    any other live contestant, are dropped from the state, and a state with
+    one contestant left is credited to them outright.
+
+    The next question is picked greedily: each remaining one is tried on up
+    to ``order_sample`` current states, and the one whose children collapse
+    into the fewest distinct states goes next. Once ``leaf_size`` questions
+    or fewer remain, each state is finished by block-scoring its
+    completions, as in ``branch_and_bound_winners``.
+
+    Pays off late in a season, when only a handful of contestants are still
+    live and states merge; with the whole field live it stays within about
+    twice the time of ``branch_and_bound_winners``.
+
+    Each state also carries how its scenarios split by number of yesses,
+    so it gives the same tallies, tie counts, per-question and yes-count
+    buckets as ``parallel_winners``; only the pair table is not tracked.
+    """
+    scorer = BlockScorer(predictions, outcomes)
+    stats = ScenarioStats(scorer.contestants, outcomes)
+    live = scorer.live.tolist()
+    alphabetical = scorer.alphabetical_ranks.tolist()
+    unresolved_count = scorer.unresolved_count
+    mask_bits = (1 << scorer.key_shift) - 1
+    pairs = list(itertools.combinations(range(len(live)), 2))
+    pair_index = {pair: i for i, pair in enumerate(pairs)}
+
+    ranking_columns = (scorer.unresolved_keys >> scorer.key_shift).T.tolist()
+    mask_columns = (scorer.unresolved_keys & mask_bits).T.tolist()
+
+    def mask_sign(tie_breaks, a, b):
+        """Sign of mask(a) - mask(b) once every question is settled."""
+        standing = tie_breaks[pair_index[min(a, b), max(a, b)]]
+        sign = 1 if standing == "+" else -1 if standing == "-" else (standing > 0) - (standing < 0)
+        return sign if a < b else -sign
+
+    def credit(scores, tie_breaks, value, done):
+        """Credits a state; questions not yet ``done`` are yes in half of it."""
+        free_count = unresolved_count - len(done)
+        count = value[0] << free_count
+        yes_counts = [
+            y << free_count if q in done else count >> 1
+            for q, y in enumerate(value[1 : 1 + unresolved_count])
+        ]
+        # the free questions add a binomial spread of extra yesses
+        yes_count_distribution = np.convolve(
+            np.array(value[1 + unresolved_count :], dtype=np.int64),
+            [math.comb(free_count, k) for k in range(free_count + 1)],
+        )[: unresolved_count + 1]
+        tied = [c for c, s in enumerate(scores) if s == 0]
+        winner = tied[0]
+        for c in tied[1:]:
+            sign = mask_sign(tie_breaks, c, winner)
+            # identical correct rankings: first alphabetically, as in tie_breaker
+            if sign > 0 or (sign == 0 and alphabetical[c] < alphabetical[winner]):
+                winner = c
+        stats.add_group(
+            live[winner], [live[c] for c in tied], count, yes_counts, yes_count_distribution
+        )
+
+    def finish(state, value, keys, remaining):
+        """
+        Credits a state by block-scoring every way the ``remaining`` questions go.
+
+        Everything merged into a state ends the same way for each of those
+        completions, so the composite ``keys`` of any one of its partial
+        scenarios stand in for all of them.
+        """
+        columns = np.array([c for c, s in enumerate(state[0]) if s is not None])
+        shifts = np.arange(len(remaining) - 1, -1, -1)
+        bits = (np.arange(2 ** len(remaining))[:, None] >> shifts) & 1
+        block = keys[columns] + bits @ scorer.unresolved_keys[np.ix_(columns, remaining)].T
+        _max_scores, best, tied = settle_winners(
+            block, scorer.key_shift, scorer.alphabetical_ranks[columns]
+        )
+        # one code per (winner, tie set), so completions group with a 1-D unique
+        if len(columns) < 48:
+            codes = (tied @ (1 << np.arange(len(columns), dtype=np.int64))) * len(columns) + best
+        else:
+            codes = np.unique(np.column_stack([best, tied]), axis=0, return_inverse=True)[1]
+        _codes, first_rows, group_of_row = np.unique(
+            codes.ravel(), return_index=True, return_inverse=True
+        )
+
+        count = value[0]
+        decided_yes = np.array(value[1 : 1 + unresolved_count], dtype=np.int64)
+        decided_by_yes_count = np.array(value[1 + unresolved_count :], dtype=np.int64)
+        row_yes = bits.sum(axis=1)
+        for group, first in enumerate(first_rows.tolist()):
+            rows = group_of_row == group
+            yes_counts = decided_yes * rows.sum()
+            yes_counts[remaining] += count * bits[rows].sum(axis=0)
+            yes_count_distribution = np.convolve(
+                decided_by_yes_count, np.bincount(row_yes[rows], minlength=len(remaining) + 1)
+            )[: unresolved_count + 1]
+            stats.add_group(
+                live[columns[best[first]]],
+                [live[c] for c in columns[tied[first]].tolist()],
+                count * int(rows.sum()),
+                yes_counts,
+                yes_count_distribution,
+            )
+
+    def collapse(scores, tie_breaks, upside, mask_upside, catch_up):
+        top = max(s for s in scores if s is not None)
+        scores = [None if s is None or s + u < top else s for s, u in zip(scores, upside)]
+        # anyone who can't catch some other live contestant never tops again
+        for a, b in itertools.combinations([c for c, s in enumerate(scores) if s is not None], 2):
+            if scores[a] is not None and scores[b] is not None:
+                a_gain, b_gain = catch_up[pair_index[a, b]]
+                if scores[a] - scores[b] > b_gain:
+                    scores[b] = None
+                elif scores[b] - scores[a] > a_gain:
+                    scores[a] = None
+        top = max(s for s in scores if s is not None)
+        scores = tuple(None if s is None else s - top for s in scores)
+
+        # only pairs that can still meet on score keep a tie-break standing
+        settled = [None] * len(pairs)
+        for a, b in itertools.combinations([c for c, s in enumerate(scores) if s is not None], 2):
+            i = pair_index[a, b]
+            standing = tie_breaks[i]
+            if standing not in (None, "+", "-"):
+                if standing > mask_upside[b]:
+                    standing = "+"
+                elif -standing > mask_upside[a]:
+                    standing = "-"
+            settled[i] = standing
+        return scores, tuple(settled)
+
+    def children(state, q, after):
+        """Yields (child state, is_yes) after deciding question q."""
+        scores, tie_breaks = state
+        yield collapse(scores, tie_breaks, *after), 0
+        masks = mask_columns[q]
+        yield collapse(
+            [None if s is None else s + r for s, r in zip(scores, ranking_columns[q])],
+            [
+                standing if standing in (None, "+", "-") else standing + masks[a] - masks[b]
+                for (a, b), standing in zip(pairs, tie_breaks)
+            ],
+            *after,
+        ), 1
+
+    def without(q, upside, mask_upside, catch_up):
+        """(upside, mask_upside, catch_up) once question q is decided."""
+        rankings = ranking_columns[q]
+        return (
+            [u - r for u, r in zip(upside, rankings)],
+            [u - m for u, m in zip(mask_upside, mask_columns[q])],
+            [
+                (
+                    a_gain - max(rankings[a] - rankings[b], 0),
+                    b_gain - max(rankings[b] - rankings[a], 0),
+                )
+                for (a, b), (a_gain, b_gain) in zip(pairs, catch_up)
+            ],
+        )
+
+    upside = [sum(r) for r in zip(*ranking_columns)] or [0] * len(live)
+    mask_upside = [sum(m) for m in zip(*mask_columns)] or [0] * len(live)
+    # catch_up[pair]: how much a, then b, can still gain on the other
+    catch_up = [
+        (
+            sum(max(r[a] - r[b], 0) for r in ranking_columns),
+            sum(max(r[b] - r[a], 0) for r in ranking_columns),
+        )
+        for a, b in pairs
+    ]
+    after = (upside, mask_upside, catch_up)
+    base_scores = (scorer.base_keys >> scorer.key_shift).tolist()
+    base_masks = (scorer.base_keys & mask_bits).tolist()
+    base_tie_breaks = [base_masks[a] - base_masks[b] for a, b in pairs]
+    # value: [scenario count, yes count per unresolved question,
+    #         scenario count by number of decided questions that are yes]
+    base_state = collapse(base_scores, base_tie_breaks, *after)
+    states = {base_state: [1] + [0] * unresolved_count + [1] + [0] * unresolved_count}
+    # composite keys of one partial scenario per state, for ``finish``
+    representatives = {base_state: scorer.base_keys}
+    remaining = list(range(unresolved_count))
+    done = set()
+
+    while len(remaining) > leaf_size:
+        sample = list(itertools.islice(states, order_sample))
+
+        def distinct_children(q):
+            after_q = without(q, *after)
+            return len({child for state in sample for child, _ in children(state, q, after_q)})
+
+        q = min(remaining, key=lambda q: (distinct_children(q), q))
+        remaining.remove(q)
+        done.add(q)
+        after = without(q, *after)
+
+        next_states = {}
+        next_representatives = {}
+        for state, value in states.items():
+            for child, is_yes in children(state, q, after):
+                if is_yes:
+                    by_yes_count = value[1 + unresolved_count :]
+                    child_value = value[: 1 + unresolved_count] + [0] + by_yes_count[:-1]
+                    child_value[1 + q] += value[0]
+                else:
+                    child_value = value
+
+                if sum(s is not None for s in child[0]) == 1:
+                    credit(*child, child_value, done)
+                elif child in next_states:
+                    merged = next_states[child]
+                    for i, v in enumerate(child_value):
+                        merged[i] += v
+                else:
+                    next_states[child] = list(child_value)
+                    keys = representatives[state]
+                    next_representatives[child] = (
+                        keys + scorer.unresolved_keys[:, q] if is_yes else keys
+                    )
+        states = next_states
+        representatives = next_representatives
+
+    for state, value in states.items():
+        if remaining:
+            finish(state, value, representatives[state], remaining)
+        else:
+            credit(*state, value, done)
+    return stats
+
+
+def win_interval(tally, total, z=1.96):
+    """Wilson score interval (low, high) for a share of ``tally`` out of ``total``."""
+    share = tally / total
+    denominator = 1 + z**2 / total
+    center = (share + z**2 / (2 * total)) / denominator
+    half_width = z * np.sqrt(share * (1 - share) / total + z**2 / (4 * total**2))
+    half_width /= denominator
+    return center - half_width, center + half_width
+
+
+def monte_carlo_winners(
+    predictions,
+    outcomes,
+    target_width=0.01,
+    seed=2025,
+    batch_size=DEFAULT_BLOCK_SIZE,
+    max_samples=None,
+):
+    """
+    Estimates the stats from randomly drawn scenarios instead of all of them.
+
+    Every unresolved question is an independent fair coin. Batches of
+    ``batch_size`` scenarios are drawn and scored until each contestant's 95%
+    interval (``win_interval``) on their win share is at most
+    ``target_width`` wide, or ``max_samples`` have been drawn. The counters
+    then hold sample counts, so shares are still ``tally / stats.total``.
+
+    The same ``seed`` always draws the same scenarios. Once the draws would
+    reach ``2 ** unresolved`` (the next batch, or ``max_samples``, is at
+    least that many), every scenario is scored once instead and the counts
+    are exact; ``stats.sampled`` tells the two apart.
+    """
+    scenario_count = 2 ** outcomes.count("m")
+    if max_samples is not None and scenario_count <= max_samples:
+        return vectorized_winners(predictions, outcomes)
+
+    scorer = BlockScorer(predictions, outcomes)
+    stats = ScenarioStats(scorer.contestants, outcomes)
+    stats.sampled = True
+    rng = np.random.default_rng(seed)
+
+    while max_samples is None or stats.total < max_samples:
+        size = batch_size
+        if max_samples is not None:
+            size = min(size, max_samples - stats.total)
+        if stats.total + size >= scenario_count:
+            return vectorized_winners(predictions, outcomes)
+        bits = rng.integers(0, 2, size=(size, scorer.unresolved_count), dtype=np.int64)
+        _bits, _max_scores, winner_indices, at_max = scorer.winners_for_bits(bits)
+        stats.add_block(bits, winner_indices, at_max)
+
+        low, high = win_interval(stats.winner_tally, stats.total)
+        if (high - low).max() <= target_width:
+            break
+    return stats
+
+
+# serial engines, selected by name (ENGINE=... on the command line)
+WINNER_ENGINES = {
+    "loop": loop_winners,
+    "vectorized": vectorized_winners,
+    "gray": gray_code_winners,
+    "lookup": byte_table_winners,
+    "bitsliced": bit_sliced_winners,
+    "bnb": branch_and_bound_winners,
+    "dp": state_dp_winners,
+}
@@ -0,0 +1,140 @@
+"""
+Turns raw entry sheets into a data/<year>.json file.
+
+Two formats are read, told apart by the header line:
+- CSV with a name column, as in data/raw-transcription-of-guesses.txt:
+  ``Name,A,B,...`` then ``Melody,22,7,...``
+- a whitespace table with question letters across the top and an emoji
+  (or name) starting each row, as in 2023-raw-input.csv
+
+The input is read once, line by line. Every row is checked as it streams
+past, and all bad rows are reported with their line numbers before
+anything is written.
+
+Usage: python -m prediction_game.ingest <input> <output.json> <year>
+
+If the output file already exists, its question descriptions and outcomes
+are kept and only the predictions are replaced.
+"""
+
+import csv
+import json
+import os
+import sys
+
+from .loader import validate_rankings
+
+# rows checked together by validate_rankings while streaming
+BATCH_SIZE = 4096
+
+
+def read_entries(lines):
+    """
+    Reads the header and returns (question_ids, entries).
+
+    ``entries`` lazily yields (line_number, name, rankings, problem) per
+    row; ``problem`` is None for a usable row, otherwise a description.
+    Rows are validated in batches of ``BATCH_SIZE`` as they stream past,
+    so rows with a problem found earlier can come out ahead of their line.
+    """
+    lines = iter(lines)
+    header = next(lines, "")
+    if "," in header:
+        header_fields = next(csv.reader([header]))
+        rows = csv.reader(lines)
+    else:
+        header_fields = [""] + header.split()
+        rows = (line.split() for line in lines)
+    # skip the name column and any trailing non-question markers ("=")
+    question_ids = [field.strip() for field in header_fields[1:] if field.strip().isalnum()]
+    return question_ids, _entries(rows, question_ids)
+
+
+def _entries(rows, question_ids):
+    batch = []
+    for line_number, fields in enumerate(rows, start=2):
+        fields = [field.strip() for field in fields]
+        # blank lines, and the header repeated under a long table
+        if not any(fields) or set(question_ids) <= set(fields):
+            continue
+        name, values = fields[0], [value for value in fields[1:] if value]
+        if not name:
+            yield line_number, name, [], "missing name"
+            continue
+        try:
+            rankings = [int(value) for value in values]
+        except ValueError:
+            yield line_number, name, [], f"non-numeric ranking in {values}"
+            continue
+        if len(rankings) != len(question_ids):
+            yield line_number, name, rankings, (
+                f"has {len(rankings)} rankings, expected {len(question_ids)}"
+            )
+            continue
+        batch.append((line_number, name, rankings))
+        if len(batch) == BATCH_SIZE:
+            yield from _checked(batch)
+            batch = []
+    yield from _checked(batch)
+
+
+def _checked(batch):
+    """Yields the batch's rows with any problem found by ``validate_rankings``."""
+    problems = validate_rankings([rankings for _line, _name, rankings in batch])
+    for row, (line_number, name, rankings) in enumerate(batch):
+        yield line_number, name, rankings, problems.get(row)
+
+
+def ingest(input_path, output_path, year):
+    """Reads ``input_path`` and writes the data file; returns the list of problems."""
+    predictions = {}
+    problems = []
+    with open(input_path, newline="", encoding="utf-8") as f:
+        question_ids, entries = read_entries(f)
+        for line_number, name, rankings, problem in entries:
+            if name in predictions:
+                problem = f"duplicate entry for {name}"
+            if problem:
+                problems.append((line_number, f"line {line_number}: {name}: {problem}"))
+            else:
+                predictions[name] = rankings
+    if problems:
+        # rows that fail before batching are reported ahead of their batch
+        return [problem for _line, problem in sorted(problems)]
+
+    data = {
+        "year": year,
+        "questions": {question: "" for question in question_ids},
+        "outcomes": {question: "m" for question in question_ids},
+    }
+    if os.path.exists(output_path):
+        with open(output_path, encoding="utf-8") as f:
+            existing = json.load(f)
+        if sorted(existing.get("questions", {})) == sorted(question_ids):
+            data["questions"] = existing["questions"]
+            data["outcomes"] = existing["outcomes"]
+    data["predictions"] = predictions
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return []
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3:
+        print("Usage: python -m prediction_game.ingest <input> <output.json> <year>")
+        sys.exit(1)
+    input_path, output_path, year = argv
+    problems = ingest(input_path, output_path, int(year))
+    if problems:
+        print(f"{len(problems)} bad rows in {input_path}; nothing written:")
+        for problem in problems:
+            print("  " + problem)
+        sys.exit(1)
+    print(f"wrote {output_path}")
+
+
+if __name__ == "__main__":
+    main()
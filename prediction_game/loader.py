@@ -0,0 +1,138 @@
+"""
+Season data loading for the data/<year>.json schema.
+
+A data file has ``year``, ``questions`` (id -> description), ``outcomes``
+(id -> "y"/"n"/"m", or a chance of yes between 0 and 1 for an unresolved
+question) and ``predictions`` (contestant -> one ranking per question, in
+question id order).
+"""
+
+import json
+
+import numpy as np
+
+from .engine import Rankings
+
+
+def validate_game(questions, outcomes, predictions):
+    """Returns a list of problems with the raw season data; empty if it's usable."""
+    errors = []
+    question_count = len(questions)
+
+    for question, outcome in outcomes.items():
+        if question not in questions:
+            errors.append(f"Outcome '{question}' has no matching question")
+        elif isinstance(outcome, str):
+            if outcome not in ("y", "n", "m"):
+                errors.append(f"Outcome '{question}' is {outcome!r}, expected y, n or m")
+        elif isinstance(outcome, bool) or not isinstance(outcome, (int, float)):
+            errors.append(
+                f"Outcome '{question}' is {json.dumps(outcome)}, "
+                "expected y, n, m or a probability"
+            )
+        elif not 0 <= outcome <= 1:
+            errors.append(f"Outcome '{question}' probability {outcome} is not between 0 and 1")
+
+    names = list(predictions)
+    for name in names:
+        if len(predictions[name]) != question_count:
+            errors.append(
+                f"{name}: has {len(predictions[name])} rankings, expected {question_count}"
+            )
+    names = [name for name in names if len(predictions[name]) == question_count]
+    rankings = np.array([predictions[name] for name in names], dtype=np.int64)
+    problems = validate_rankings(rankings.reshape(len(names), question_count))
+    errors.extend(f"{names[row]}: {problem}" for row, problem in problems.items())
+    return errors
+
+
+def validate_rankings(rankings):
+    """
+    Checks that every row of ``rankings`` is a permutation of 1..N at once.
+
+    ``rankings`` is a contestants x N integer matrix. Rows are sorted and
+    compared with 1..N in one step; only the rows that fail are then
+    counted (one bincount over the bad rows) to name their missing,
+    duplicated and out-of-range ranks. Returns {row index: problem} for
+    the bad rows only.
+    """
+    rankings = np.asarray(rankings, dtype=np.int64)
+    if rankings.size == 0:
+        return {}
+    question_count = rankings.shape[1]
+    valid = (np.sort(rankings, axis=1) == np.arange(1, question_count + 1)).all(axis=1)
+    bad_rows = np.flatnonzero(~valid)
+    if not len(bad_rows):
+        return {}
+
+    bad = rankings[bad_rows]
+    in_range = (bad >= 1) & (bad <= question_count)
+    # out-of-range ranks land in column 0, so columns 1..N count each rank
+    offsets = np.arange(len(bad_rows))[:, None] * (question_count + 1)
+    counts = np.bincount(
+        (offsets + np.where(in_range, bad, 0)).ravel(),
+        minlength=len(bad_rows) * (question_count + 1),
+    ).reshape(len(bad_rows), question_count + 1)[:, 1:]
+
+    problems = {}
+    for i, row in enumerate(bad_rows.tolist()):
+        missing = (np.flatnonzero(counts[i] == 0) + 1).tolist()
+        duplicates = (np.flatnonzero(counts[i] > 1) + 1).tolist()
+        invalid = sorted(set(bad[i][~in_range[i]].tolist()))
+        problems[row] = (
+            f"invalid rankings - missing {missing}, "
+            f"duplicates {duplicates}, invalid {invalid}"
+        )
+    return problems
+
+
+class GameData:
+    """
+    One season, checked and converted once for the engines.
+
+    ``outcomes`` is a list in ``question_ids`` order with every unresolved
+    question as "m"; any given chances of yes are kept in ``probabilities``.
+    ``rankings`` is the contestants x questions int64 matrix, built once;
+    ``predictions`` is a ``Rankings`` mapping over it, so the engines use the
+    matrix as is while anything else can read it like a dict.
+    """
+
+    def __init__(self, year, questions, outcomes, predictions):
+        errors = validate_game(questions, outcomes, predictions)
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        self.year = year
+        self.question_ids = sorted(questions)
+        self.questions = {question: questions[question] for question in self.question_ids}
+        self.probabilities = {
+            question: outcome
+            for question, outcome in outcomes.items()
+            if not isinstance(outcome, str)
+        }
+        self.outcomes = [
+            "m" if question in self.probabilities else outcomes.get(question, "m")
+            for question in self.question_ids
+        ]
+        self.contestants = list(predictions)
+        self.rankings = np.array(
+            [predictions[contestant] for contestant in self.contestants], dtype=np.int64
+        ).reshape(len(self.contestants), len(self.question_ids))
+        self.predictions = Rankings(self.contestants, self.rankings)
+
+    def unresolved_probabilities(self):
+        """Chance of yes per unresolved question (0.5 if not given), or None."""
+        if not self.probabilities:
+            return None
+        return [
+            self.probabilities.get(question, 0.5)
+            for question, outcome in zip(self.question_ids, self.outcomes)
+            if outcome == "m"
+        ]
+
+
+def load_game(path):
+    """Reads and validates a season data file; raises ValueError listing every problem."""
+    with open(path) as f:
+        data = json.load(f)
+    return GameData(data["year"], data["questions"], data["outcomes"], data["predictions"])
@@ -0,0 +1,375 @@
+"""
+The printed season report, built from a ``ScenarioStats``.
+"""
+
+import json
+import statistics
+
+import numpy as np
+
+from .counting import distribution_summary, head_to_head, score_distributions
+from .engine import win_interval
+
+# the head-to-head matrix is printed for fields up to this size
+HEAD_TO_HEAD_LIMIT = 40
+
+
+def print_report(game, stats, sampled=False, what_if=None, json_output=None, full_guts=False):
+    """
+    Prints win-paths, needs, per-question and yes-count sections for ``game``.
+
+    ``sampled`` adds confidence intervals (Monte Carlo stats), ``what_if``
+    maps up to two question ids to "y"/"n" for a conditional breakdown,
+    ``json_output`` is a path for the machine-readable summary and
+    ``full_guts`` dumps every need percentage.
+    """
+    predictions = game.predictions
+    question_ids = game.question_ids
+    outcomes = game.outcomes
+    outcome_by_question = dict(zip(question_ids, outcomes))
+    weighted = bool(game.probabilities)
+    total_possible = stats.total
+
+    def count_text(count):
+        """Scenario counts print as-is; weighted ones as a share of all outcomes."""
+        return "{:.2%}".format(count / total_possible) if weighted else str(count)
+
+    # Question 1: how many total possible win paths per person?
+    winner_tally = {
+        contestant: tally.item()
+        for contestant, tally in zip(stats.contestants, stats.winner_tally)
+    }
+    
+    # Count tie scenarios
+    tie_scenarios = stats.tie_scenarios
+    
+    percentage_wins = winner_tally.copy()
+    for winner, tally in percentage_wins.items():
+        percentage_wins[winner] = float(tally) / float(total_possible)
+    ordered_winner_percentages = sorted(
+        percentage_wins.items(), key=lambda x: x[1], reverse=True
+    )
+
+    # Question 1b: how many points does each person currently have?
+
+    contestant_current_scores = {k: 0 for k in predictions}
+    for contestant, point_allocations in predictions.items():
+        score = 0
+        for yes_no_maybe, points_allocated in zip(
+            outcomes, point_allocations
+        ):
+            if yes_no_maybe == "y":
+                score += points_allocated
+        contestant_current_scores[contestant] = score
+
+    # Identify tie-only contestants (those who can only win through ties)
+    tie_only_contestants = set(stats.tie_only_contestants())
+
+    # exact final score distributions (see counting.score_distributions)
+    distributions = score_distributions(predictions, outcomes, game.unresolved_probabilities())
+    distributions = dict(zip(predictions, distributions.tolist()))
+
+    # machine-readable counters
+    if json_output:
+        summary = stats.summary()
+        for contestant, score in contestant_current_scores.items():
+            summary["contestants"][contestant]["score"] = score
+            summary["contestants"][contestant]["score_distribution"] = {
+                final: count for final, count in enumerate(distributions[contestant]) if count
+            }
+        with open(json_output, "w") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    print("percent of win-paths per person (score so far in parentheses)")
+    
+    # Separate contestants into different categories for proper ordering
+    active_contestants = []
+    tie_only_contestants_list = []
+    eliminated_contestants = []
+    
+    for winner, p in ordered_winner_percentages:
+        if p > 0.0:
+            active_contestants.append((winner, p))
+        elif winner in tie_only_contestants:
+            tie_only_contestants_list.append((winner, p))
+        else:
+            eliminated_contestants.append((winner, p))
+    
+    # Print active contestants first
+    for winner, p in active_contestants:
+        score = contestant_current_scores[winner]
+        percent_format = "{:.3%}" if p < 0.01 else "{:.1%}"  # Less than 1%
+        if sampled:
+            low, high = win_interval(winner_tally[winner], total_possible)
+            interval = "[" + percent_format.format(low) + ", " + percent_format.format(high) + "]"
+            print(winner, ": ", percent_format.format(p), interval, "({})".format(score))
+        else:
+            print(winner, ": ", percent_format.format(p), "({})".format(score))
+    
+    # Print tie-only contestants
+    for winner, p in tie_only_contestants_list:
+        score = contestant_current_scores[winner]
+        # Calculate actual percentage of tie scenarios for this contestant
+        tie_scenario_count = stats.tie_participation[stats.contestants.index(winner)]
+        tie_percentage = tie_scenario_count / total_possible
+        if tie_percentage < 0.01:  # Less than 1%
+            print(winner, ": ", "{:.3%}".format(tie_percentage), "(tie-only paths)", "({})".format(score))
+        else:
+            print(winner, ": ", "{:.1%}".format(tie_percentage), "(tie-only paths)", "({})".format(score))
+    
+    # Print eliminated contestants last
+    for winner, p in eliminated_contestants:
+        score = contestant_current_scores[winner]
+        print(winner, ": ", "0.0% (eliminated)", "({})".format(score))
+    
+    print(f"\nTie-breaking Analysis:")
+    print(f"  - Total tie scenarios before tie-breaking: {count_text(tie_scenarios)} ({tie_scenarios/total_possible:.1%})")
+    print(f"  - All ties resolved using highest-ranked prediction method")
+    if tie_only_contestants:
+        print(f"  - Contestants who can only win through ties: {', '.join(sorted(tie_only_contestants))}")
+    else:
+        print("  - No contestants can only win through ties")
+
+    # Question 2: which events are most necessary for each person to win?
+
+    # Count everyone involved in win or tie
+    win_or_tie_tally = dict(zip(stats.contestants, stats.win_or_tie_tally.tolist()))
+
+    # share of each person's win-or-tie paths where each maybe-question came true
+    maybe_positions = [idx for idx, outcome in enumerate(outcomes) if outcome == "m"]
+    maybe_questions = [list(question_ids)[idx] for idx in maybe_positions]
+    # yes / (yes + no) rather than yes / win_or_tie_tally, so the shares hold
+    # when the tallies are probabilities (all below 1) as well as counts
+    yes_counts = stats.question_buckets[:, maybe_positions, 0]
+    paths = yes_counts + stats.question_buckets[:, maybe_positions, 1]
+    need_shares = np.divide(
+        yes_counts, paths, out=np.zeros(paths.shape, dtype=np.float64), where=paths > 0
+    )
+
+    each_person_question_percentage = {
+        person: dict(zip(maybe_questions, need_shares[stats.contestants.index(person)].tolist()))
+        for person, _p in ordered_winner_percentages
+        if win_or_tie_tally[person] > 0
+    }
+
+    for person, questions in each_person_question_percentage.items():
+        win_count = win_or_tie_tally[person]
+        
+        print(
+            "Contestant "
+            + person
+            + " has "
+            + count_text(win_count)
+            + " ways to win, and needs the following to happen (high percentages) or not (low percentages)"
+        )
+
+        ordered_qs_by_need_percent = sorted(
+            questions.items(), key=lambda x: x[1], reverse=True
+        )
+
+        if full_guts:
+            print(questions)
+
+            # unpack the tuple
+        # a finished season has no open questions left to need
+        if ordered_qs_by_need_percent:
+            print("\t{}: {:.1%}".format(*ordered_qs_by_need_percent[0]))
+            print("\t{}: {:.1%}".format(*ordered_qs_by_need_percent[-1]))
+
+    # Question 3: for each maybe-question, what happens?
+    print("Question 3: for each maybe-question, what happens?")
+
+    maybe_question_need_by_person = {}
+
+    for question, outcome in outcome_by_question.items():
+        if outcome == "m":
+            maybe_question_need_by_person[question] = {}
+
+    for person, questions in each_person_question_percentage.items():
+        for question, percentage in questions.items():
+            maybe_question_need_by_person[question][person] = percentage
+
+    for question, person_percentages in maybe_question_need_by_person.items():
+        print(
+            "Question "
+            + question
+            + " coming TRUE will help (high percentages) or hurt (low percentages) these people"
+        )
+
+        ordered_people_by_need_percent = sorted(
+            person_percentages.items(), key=lambda x: x[1], reverse=True
+        )
+
+        for person_need_percent in ordered_people_by_need_percent:
+            print("\t{}: {:.1%}".format(*person_need_percent))
+
+    # Question 3b: what if two maybe-questions both go a given way?
+    # answered from the pair table, no re-enumeration
+    if what_if:
+        conditions = what_if
+        question_positions = {question: idx for idx, question in enumerate(question_ids)}
+        wins, matching = stats.what_if(
+            {question_positions[question]: outcome for question, outcome in conditions.items()}
+        )
+        print("What if " + ", ".join(f"{q}={o}" for q, o in conditions.items()) + "?")
+        for person, person_wins in sorted(
+            zip(stats.contestants, wins.tolist()), key=lambda x: x[1], reverse=True
+        ):
+            if person_wins:
+                print("\t{}: {:.1%}".format(person, person_wins / matching))
+
+    # Question 4: who wins, organized by how many "yes" outcomes
+    print("Question 4: who wins, organized by how many more 'yes' outcomes")
+
+    maybes_count = outcomes.count("m")
+
+    # def new_tally_by_guesser():
+    #    return {"tie": 0}
+
+    how_many_more_yes_buckets = {k: {} for k in range(maybes_count + 1)}
+
+    for person, _p in ordered_winner_percentages:
+        person_yes_buckets = stats.yes_buckets[stats.contestants.index(person)]
+        for how_many_more_yes, count in enumerate(person_yes_buckets.tolist()):
+            if count:
+                how_many_more_yes_buckets[how_many_more_yes][person] = count
+
+    for how_many_more_yes_bucket, person_counts in how_many_more_yes_buckets.items():
+        print(
+            "If there are "
+            + str(how_many_more_yes_bucket)
+            + " more yesses, then these people have win-paths:"
+        )
+
+        ordered_people_by_count = sorted(
+            person_counts.items(), key=lambda x: x[1], reverse=True
+        )
+
+        for person, count in ordered_people_by_count:
+            print("\t{}: {}".format(person, count_text(count)))
+
+    # Question 5: who finishes ahead of whom on points, counted exactly
+    # without enumerating scenarios (see counting.head_to_head)
+    if len(predictions) <= HEAD_TO_HEAD_LIMIT:
+        print("Question 5: head-to-head, share of outcomes where the row finishes ahead of the column")
+        ahead = head_to_head(predictions, outcomes, game.unresolved_probabilities())
+        outcome_count = 1.0 if weighted else 2 ** outcomes.count("m")
+        order = [stats.contestants.index(person) for person, _p in ordered_winner_percentages]
+        print("    " + "".join("{:>7}".format(column + 1) for column in range(len(order))))
+        for row, person in enumerate(order):
+            cells = [
+                "{:>7}".format(
+                    "-" if other == person else "{:.1%}".format(ahead[person, other] / outcome_count)
+                )
+                for other in order
+            ]
+            print("{:>3} ".format(row + 1) + "".join(cells) + "  " + stats.contestants[person])
+
+    # Question 6: where can each person's final score land?
+    print("Question 6: final score distribution (mean, percentiles, range)")
+    for person, _p in ordered_winner_percentages:
+        distribution = distributions[person]
+        mean, percentiles = distribution_summary(distribution)
+        reachable = [final for final, count in enumerate(distribution) if count]
+        print(
+            "\t{}: mean {:.1f}, ".format(person, mean)
+            + ", ".join("p{} {}".format(q, final) for q, final in percentiles.items())
+            + ", range {}-{}".format(reachable[0], reachable[-1])
+        )
+        if full_guts:
+            histogram = ["{}:{}".format(final, count_text(distribution[final])) for final in reachable]
+            print("\t\t" + " ".join(histogram))
+
+    # do people have more win-paths because they're just guessing differently than the wisdom of the crowds?
+    # Or does someone have reasonable guesses, and also a clear opportunity?
+    def mean_difference_analysis():
+
+        questions_values = {}
+
+        for index, question in enumerate(question_ids):
+            this_question_values = []
+            for prediction_list in predictions.values():
+                this_question_values.append(prediction_list[index])
+
+            questions_values[question] = this_question_values
+
+        questions_means = {
+            q: statistics.mean(values) for (q, values) in questions_values.items()
+        }
+        questions_means_sorted = dict(
+            sorted(questions_means.items(), key=lambda item: item[1], reverse=True)
+        )
+        questions_means_sorted_rounded = {
+            q: round(mean, 1) for (q, mean) in questions_means_sorted.items()
+        }
+        print()
+        print("mean question ranking")
+        print(questions_means_sorted_rounded)
+
+        questions_medians = {
+            q: statistics.median(values) for (q, values) in questions_values.items()
+        }
+        questions_medians_sorted = dict(
+            sorted(questions_medians.items(), key=lambda item: item[1], reverse=True)
+        )
+        print()
+        print("median question ranking")
+        print(questions_medians_sorted)
+
+        # what would the mean prediction order be? mostly driven by the mean, with some influence from median
+        mm_prediction = predictions.get("MM")
+
+        if mm_prediction is None:
+            print("skipping mean error analysis")
+            return
+
+        mean_absolute_error_by_person = {}
+        for person, prediction in predictions.items():
+            absolute_errors = []
+            for p1, p2 in zip(prediction, mm_prediction):
+                absolute_errors.append(abs(p1 - p2))
+            mean_absolute_error_by_person[person] = round(
+                statistics.mean(absolute_errors), 2
+            )
+
+        mae_sorted = dict(
+            sorted(
+                mean_absolute_error_by_person.items(),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        )
+        print()
+        print("mean absolute error from the collective mean prediction")
+        print(mae_sorted)
+
+    mean_difference_analysis()
+
+    # Add consolidated must-have predictions analysis
+    print("\nMUST-HAVE PREDICTIONS (100% or 0% needed):")
+    for contestant in ordered_winner_percentages:
+        name = contestant[0]
+        if name not in each_person_question_percentage:
+            continue
+
+        must_haves = []
+        is_tie_only = name in tie_only_contestants
+
+        for question_id, percentage in each_person_question_percentage[name].items():
+            if percentage == 1.0:
+                must_haves.append(f"{question_id} must be TRUE")
+            elif percentage == 0.0:
+                must_haves.append(f"{question_id} must be FALSE")
+
+        if must_haves or is_tie_only:
+            print(f"\n{name} needs:")
+            if is_tie_only:
+                print(f"  - Can only win through tie-breaking scenarios")
+
+            for must_have in must_haves:
+                if is_tie_only:
+                    print(f"  - {must_have} (in tie scenarios)")
+                else:
+                    print(f"  - {must_have}")
+
+    print("\nskipping mean error analysis")
@@ -0,0 +1,135 @@
+"""
+Cross-checks for the Python engines: every engine against the plain loop,
+the composite tie-break keys against ``tie_breaker`` on the archive
+seasons, and the counting shortcuts against enumeration.
+
+Run from the repository root: python -m pytest tests
+"""
+
+import glob
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "..", "tools")
+sys.path.insert(0, TOOLS_DIR)
+
+import check_tie_keys  # noqa: E402
+
+from prediction_game import counting, engine, loader  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+STAT_FIELDS = [
+    "total",
+    "tie_scenarios",
+    "winner_tally",
+    "direct_wins",
+    "tie_participation",
+    "win_or_tie_tally",
+    "question_buckets",
+    "yes_buckets",
+    "pair_yes_wins",
+]
+
+ARCHIVE_SEASONS = sorted(
+    glob.glob(os.path.join(check_tie_keys.ARCHIVE_DIR, "prediction-possibilities-*.py"))
+)
+
+
+def random_season(seed, question_count=7, contestant_count=5):
+    """Random rankings with a duplicated entry and a mix of y/n/m outcomes."""
+    rng = np.random.default_rng(seed)
+    predictions = {
+        f"c{idx}": (rng.permutation(question_count) + 1).tolist()
+        for idx in range(contestant_count)
+    }
+    # identical rankings exercise the alphabetical fallback
+    predictions["c0 again"] = list(predictions["c0"])
+    outcomes = [str(rng.choice(["y", "n", "m", "m"])) for _ in range(question_count)]
+    return predictions, outcomes
+
+
+def assert_same_stats(expected, actual, fields=STAT_FIELDS):
+    for field in fields:
+        np.testing.assert_array_equal(
+            getattr(actual, field), getattr(expected, field), err_msg=field
+        )
+
+
+@pytest.mark.parametrize("path", ARCHIVE_SEASONS, ids=os.path.basename)
+def test_tie_keys_match_tie_breaker(path):
+    predictions, question_ids = check_tie_keys.load_season(path)
+    checked, disagreements = check_tie_keys.check_season(
+        predictions, len(question_ids), random.Random(2025)
+    )
+    assert checked > 0
+    assert disagreements == 0
+
+
+@pytest.mark.parametrize("name", sorted(engine.WINNER_ENGINES))
+@pytest.mark.parametrize("seed", range(6))
+def test_engines_match_loop(name, seed):
+    predictions, outcomes = random_season(seed)
+    expected = engine.loop_winners(predictions, outcomes)
+    actual = engine.WINNER_ENGINES[name](predictions, outcomes)
+    # the state DP does not track the pair table
+    fields = [field for field in STAT_FIELDS if name != "dp" or field != "pair_yes_wins"]
+    assert_same_stats(expected, actual, fields)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_matches_loop(workers):
+    predictions, outcomes = random_season(10, question_count=9)
+    expected = engine.loop_winners(predictions, outcomes)
+    assert_same_stats(expected, engine.parallel_winners(predictions, outcomes, workers=workers))
+
+
+def test_fully_resolved_season():
+    predictions, outcomes = random_season(11)
+    outcomes = ["y" if outcome == "m" else outcome for outcome in outcomes]
+    expected = engine.loop_winners(predictions, outcomes)
+    assert expected.total == 1
+    for name, winners in engine.WINNER_ENGINES.items():
+        assert_same_stats(expected, winners(predictions, outcomes))
+
+
+def test_engines_take_loaded_rankings():
+    game = loader.load_game(os.path.join(DATA_DIR, "2026-test.json"))
+    outcomes = ["y"] * 6 + game.outcomes[6:]
+    plain = dict(game.predictions)
+    expected = engine.vectorized_winners(plain, outcomes)
+    assert isinstance(game.predictions, engine.Rankings)
+    assert_same_stats(expected, engine.vectorized_winners(game.predictions, outcomes))
+    assert_same_stats(expected, engine.loop_winners(game.predictions, outcomes))
+    assert_same_stats(expected, engine.parallel_winners(game.predictions, outcomes, workers=3))
+
+
+def enumerated_scores(predictions, outcomes):
+    """Scenarios x contestants final scores, by brute force."""
+    rankings = np.array(list(predictions.values()), dtype=np.int64)
+    unresolved = [idx for idx, outcome in enumerate(outcomes) if outcome == "m"]
+    is_yes = np.array([outcome == "y" for outcome in outcomes])
+    bits = (np.arange(2 ** len(unresolved))[:, None] >> np.arange(len(unresolved))) & 1
+    return rankings[:, is_yes].sum(axis=1) + bits @ rankings[:, unresolved].T
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_head_to_head_matches_enumeration(seed):
+    predictions, outcomes = random_season(seed, question_count=9)
+    scores = enumerated_scores(predictions, outcomes)
+    expected = (scores[:, :, None] > scores[:, None, :]).sum(axis=0)
+    np.testing.assert_array_equal(counting.head_to_head(predictions, outcomes), expected)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_score_distributions_match_enumeration(seed):
+    predictions, outcomes = random_season(seed, question_count=9)
+    scores = enumerated_scores(predictions, outcomes)
+    distributions = counting.score_distributions(predictions, outcomes)
+    for contestant in range(len(predictions)):
+        expected = np.bincount(scores[:, contestant], minlength=distributions.shape[1])
+        np.testing.assert_array_equal(distributions[contestant], expected)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tie-Break Key Check
+
+Confirms that the composite (score, 2**rank mask) keys used by the
+prediction_game engine pick the same winner as the original level-by-level
+tie_breaker, for every archived season.
+
+For each season the first questions are fixed to random y/n values and the
+last few are left unresolved; every scenario that ends in a tie on the top
+score is settled both ways and compared.
+
+Exits non-zero on the first season with a disagreement.
+"""
+
+import ast
+import glob
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prediction_game import engine
+
+ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), "..", "archive")
+UNRESOLVED_PER_RUN = 14
+RUNS_PER_SEASON = 8
+
+
+def load_season(path):
+    """Reads the module-level predictions/known_outcomes without running the script."""
+    season = {}
+    for node in ast.parse(open(path).read()).body:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in ("predictions", "known_outcomes"):
+                season[name] = ast.literal_eval(node.value)
+    return season["predictions"], list(season["known_outcomes"])
+
+
+def check_season(predictions, question_count, rng):
+    """Returns (tie scenarios checked, disagreements)."""
+    checked = 0
+    disagreements = 0
+    for _run in range(RUNS_PER_SEASON):
+        outcomes = [rng.choice("yn") for _ in range(question_count)]
+        outcomes[-UNRESOLVED_PER_RUN:] = ["m"] * UNRESOLVED_PER_RUN
+        scorer = engine.BlockScorer(predictions, outcomes)
+
+        for block_start, bits, _max, winner_indices, at_max in scorer.blocks():
+            for row in np.flatnonzero(at_max.sum(axis=1) > 1):
+                current_outcome = list(outcomes)
+                for idx, bit in zip(scorer.unresolved_indices, bits[row]):
+                    current_outcome[idx] = "y" if bit else "n"
+                tied = [scorer.contestants[c] for c in np.flatnonzero(at_max[row])]
+                expected = engine.tie_breaker(predictions, current_outcome, tied)
+
+                checked += 1
+                if scorer.contestants[winner_indices[row]] != expected:
+                    disagreements += 1
+    return checked, disagreements
+
+
+def main():
+    rng = random.Random(2025)
+    failed = False
+
+    for path in sorted(glob.glob(os.path.join(ARCHIVE_DIR, "prediction-possibilities-*.py"))):
+        predictions, question_ids = load_season(path)
+        checked, disagreements = check_season(predictions, len(question_ids), rng)
+        status = "OK" if disagreements == 0 else "MISMATCH"
+        print(f"{os.path.basename(path)}: {checked} tie scenarios, {disagreements} disagreements - {status}")
+        failed = failed or disagreements > 0
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,14 @@ the collective sentiment about which predictions are most/least likely.
 """
 
 import json
+import os
 import sys
 from statistics import mean
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prediction_game.loader import validate_game
+
 
 def compute_wiscrowd_rankings(predictions: dict) -> list[int]:
     """
@@ -61,6 +66,14 @@ def main():
     # Load data
     with open(input_path) as f:
         data = json.load(f)
+
+    # A bad row would skew every mean, so check all of them first
+    errors = validate_game(data["questions"], data["outcomes"], data["predictions"])
+    if errors:
+        print("Validation errors:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        sys.exit(1)
     
     # Compute WISCROWD rankings
     wiscrowd = compute_wiscrowd_rankings(data["predictions"])